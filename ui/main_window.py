@@ -51,11 +51,11 @@ class LxMainWindow(
         self.smoke_report = {"status": "unknown", "required_missing": [], "probes": {}}
 
         self.repair_language_file()
-        self.apply_base_stylesheet()
 
         self.lang_handler = LanguageHandler(config_lang=self.language_preference)
         self.console_logic = ConsoleLogic(self)
         self.console_logic.set_log_profile(self.log_profile)
+        self.apply_base_stylesheet()
         self.theme_manager = ThemeHandler(self, self.console_logic)
         if self._config_migrated:
             self.save_user_config()
@@ -87,8 +87,21 @@ class LxMainWindow(
             "gpu_temp": True,
         }
         self.metric_cards = {}
+        # Flat per-kind views of metric_cards widgets for bulk restyling.
+        self._card_titles = {}
+        self._card_subtitles = {}
+        self._card_values = {}
+        self._card_sparks = {}
         self.cpu_core_graphs = {}
         self.power_sensor_graphs = {}
+        self._cpu_cores_dirty = True
+        self._power_sensors_dirty = True
+        self._cpu_core_order = None
+        self._power_sensor_order = None
+        self._power_category_defs = None
+        self._blocked_no_perms_text = self.lang_handler.tr("graph_blocked_no_permissions")
+        self._cpu_render_last_ts = 0.0
+        self._power_render_last_ts = 0.0
         self.selected_metric = "cpu"
 
         self.dynamic_metric_hidden = set()
@@ -101,6 +114,14 @@ class LxMainWindow(
         self._priv_backend_cache = None
         self._auth_verified_this_session = False
         self._psu_debug_last_log_ts = 0.0
+        self._iface_kind_cache = {}
+        self._subtitle_memo = {}
+        self._last_info_sig = None
+        self._net_bt_targets = None
+        self._last_theme_qss = None
+        self._is_dark_cached = None
+        self._primary_title_text = None
+        self._primary_subtitle_text = None
         self.build_failures = dict(build_failures or {})
 
         self.latest_sensor_values = {
@@ -126,6 +147,7 @@ class LxMainWindow(
             "sys_cpu_packages": None,
             "sys_cpu_cores_usage": [],
             "gpu_all": [],
+            "gpu_by_id": {},
             "bt_all": {},
             "psu_all": {},
         }
@@ -142,6 +164,7 @@ class LxMainWindow(
         self.show_locked_metrics_warning()
 
         self.theme_manager.apply_theme(self.theme_preference)
+        self._invalidate_theme_cache()
         self.apply_theme_overrides()
         self.h2.start(self.poll_interval_ms)
         self.console_logic.log(
@@ -24,6 +24,7 @@ class InteractionsMixin:
 
     def change_theme(self):
         self.theme_manager.apply_theme("dark")
+        self._invalidate_theme_cache()
 
     def toggle_console(self):
         if self.console_dialog.isVisible():
@@ -69,6 +70,7 @@ class InteractionsMixin:
             mode = "system"
         self.theme_preference = mode
         self.theme_manager.apply_theme(mode)
+        self._invalidate_theme_cache()
         self.apply_theme_overrides()
         if hasattr(self, "console_dialog") and self.console_dialog:
             self.console_dialog.refresh_theme_colors()
@@ -214,6 +216,8 @@ class InteractionsMixin:
 
     def retranslate_ui(self):
         tr = self.lang_handler.tr
+        self._power_category_defs = None
+        self._blocked_no_perms_text = tr("graph_blocked_no_permissions")
         self.setWindowTitle(tr("window_title"))
         self.page_title.setText(tr("performance_title"))
 
@@ -8,8 +8,193 @@ import time
 
 from ui.widgets.graph_widget import GraphWidget
 
+_RE_TM = re.compile(r"\s*\(TM\)\s*", re.IGNORECASE)
+_RE_R = re.compile(r"\s*\(R\)\s*", re.IGNORECASE)
+_RE_BRACKETS = re.compile(r"\s*\[[^\]]+\]\s*")
+_RE_MULTISPACE = re.compile(r"\s{2,}")
+_RE_LSCPU_MODEL = re.compile(r"Model name:")
+_RE_GLX_RENDERER = re.compile(r"OpenGL renderer string")
+_RE_VK_GPU_ID = re.compile(r"GPU id")
+_RE_PCI_DISPLAY = re.compile(r"VGA compatible controller|3D controller|Display controller")
+_RE_PCI_MARKETING = re.compile(r"\[([^\]]+)\]")
+_RE_STORAGE = re.compile(
+    r"nvme|ssd|hdd|sata|wdc|sandisk|seagate|kingston|sdbpnpz|pc sn|disk",
+    re.IGNORECASE,
+)
+
+_PCI_IDS_PATHS = (
+    "/usr/share/hwdata/pci.ids",
+    "/usr/share/misc/pci.ids",
+    "/usr/share/pci.ids",
+)
+
+
+def _read_sysfs_text(path):
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _first_output_line(args, pattern):
+    """Runs a command without a shell and returns its first line matching pattern."""
+    try:
+        proc = subprocess.run(args, capture_output=True, text=True, timeout=3.0)
+    except Exception:
+        return ""
+    for line in (proc.stdout or "").splitlines():
+        if pattern.search(line):
+            return line.strip()
+    return ""
+
+
+def _pci_ids_lookup(vendor_id, device_id):
+    """Resolves a sysfs vendor/device pair (e.g. 0x1002/0x67df) via the hwdata PCI ID table."""
+    ven = str(vendor_id or "").strip().lower().removeprefix("0x")
+    dev = str(device_id or "").strip().lower().removeprefix("0x")
+    if not ven or not dev:
+        return ""
+    for path in _PCI_IDS_PATHS:
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                vendor_name = None
+                for line in f:
+                    if vendor_name is None:
+                        if line[:4].lower() == ven and line[4:6] == "  ":
+                            vendor_name = line[6:].strip()
+                        continue
+                    if not line.startswith("\t"):
+                        # Reached the next vendor block without a device match.
+                        if line.strip() and not line.startswith("#"):
+                            return ""
+                        continue
+                    if line.startswith("\t\t"):
+                        continue
+                    if line[1:5].lower() == dev:
+                        device_name = line[5:].strip()
+                        # Prefer the marketing name in brackets, e.g. "GA104 [GeForce RTX 3070]".
+                        match = _RE_PCI_MARKETING.search(device_name)
+                        if match:
+                            return match.group(1).strip()
+                        return f"{vendor_name} {device_name}"
+        except OSError:
+            continue
+        return ""
+    return ""
+
+
+# (psu_all key, translation key) pairs listed in the Power details panel.
+_PSU_POWER_KEYS = (
+    ("cpu_w", "details_power_cpu"),
+    ("gpu_w", "details_power_gpu"),
+    ("disk_w", "details_power_disk"),
+    ("net_w", "details_power_net"),
+    ("board_w", "details_power_board"),
+    ("memory_w", "details_power_memory"),
+    ("other_w", "details_power_other"),
+)
+# System-wide values copied verbatim from each backend payload into latest_sensor_values.
+_SYS_KEYS = frozenset((
+    "sys_processes_total",
+    "sys_procs_running",
+    "sys_procs_blocked",
+    "sys_uptime_s",
+    "sys_load_1m",
+    "sys_load_5m",
+    "sys_load_15m",
+    "sys_mem_total_kb",
+    "sys_mem_available_kb",
+    "sys_swap_total_kb",
+    "sys_swap_free_kb",
+    "sys_cpu_count",
+    "sys_cpu_vendor",
+    "sys_cpu_packages",
+    "sys_cpu_cores_usage",
+))
+
+_CORE_SORT_KEYS = {}
+# Shared read-only fallback for missing payload sections; never mutate it.
+_EMPTY_DICT = {}
+
+
+def _core_sort_key(name):
+    """Natural order for "cpuN" names; other names sort after them. Keys are always tuples."""
+    key = _CORE_SORT_KEYS.get(name)
+    if key is None:
+        suffix = name[3:]
+        key = (0, int(suffix), "") if name.startswith("cpu") and suffix.isdigit() else (1, 0, name)
+        _CORE_SORT_KEYS[name] = key
+    return key
+
+
+def _safe_float(value, default=0.0):
+    """Coerces a backend value to float; unparsable values yield `default`."""
+    t = type(value)
+    if t is float:
+        return value
+    if t is int:
+        return float(value)
+    if value is None or value == "":
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _safe_watts(value, default=0.0):
+    """Clamps a wattage reading to >= 0; unparsable values yield `default`."""
+    value = _safe_float(value, None)
+    if value is None:
+        return default
+    return max(0.0, value)
+
 
 class MetricsMixin:
+    # Static metric names and "<prefix>:<id>" dynamic families resolved by dict lookup.
+    _DISPLAY_KEYS = {
+        "cpu": "graph_cpu_load",
+        "ram": "gauge_ram",
+        "gpu": "graph_gpu_load",
+        "psu": "graph_psu_power",
+        "net_total": "graph_net_total",
+        "cpu_temp": "graph_cpu_temp",
+        "gpu_temp": "graph_gpu_temp",
+    }
+    _PREFIX_DISPLAY_KEYS = {
+        "gpu": "graph_gpu_load",
+        "disk": "graph_disk_usage",
+        "net": "graph_net_iface",
+        "bt": "graph_bt_iface",
+    }
+    _ACCENTS = {
+        "cpu": "#42c7f5",
+        "ram": "#59d29b",
+        "gpu": "#f58f6a",
+        "psu": "#e9b44c",
+        "cpu_temp": "#ffd166",
+        "gpu_temp": "#ff7b72",
+        "net_total": "#d38cff",
+    }
+    _PREFIX_ACCENTS = {
+        "gpu": "#f58f6a",
+        "disk": "#8fb1ff",
+        "net": "#c99dff",
+        "bt": "#7cc4ff",
+    }
+    _UNLOCKED_METRICS = frozenset(("net_total", "psu"))
+    _UNLOCKED_PREFIXES = frozenset(("disk", "net", "bt"))
+    _DYNAMIC_PREFIXES = frozenset(("disk", "net", "bt"))
+    # Minimum value treated as activity for dynamic cards (idle ones get hidden).
+    _ACTIVE_THRESHOLDS = {"net": 0.02, "disk": 0.3, "bt": 0.001}
+    _FORMATTERS = {
+        "%": lambda v: f"{int(round(v))}%",
+        "C": lambda v: f"{v:.1f} C",
+        "Mbps": lambda v: f"{v:.2f} Mbps" if v < 10.0 else f"{v:.1f} Mbps",
+        "W": lambda v: f"{v:.2f} W" if v < 10.0 else f"{v:.1f} W",
+    }
+
     def _log_psu_debug_snapshot(self, psu_all):
         if not isinstance(psu_all, dict):
             return
@@ -24,13 +209,13 @@ class MetricsMixin:
         source = str(psu_all.get("source") or "none")
         total_w = float(psu_all.get("total_w", 0.0) or 0.0)
         cats = {
-            "cpu": float(psu_all.get("cpu_w", 0.0) or 0.0),
-            "gpu": float(psu_all.get("gpu_w", 0.0) or 0.0),
-            "disk": float(psu_all.get("disk_w", 0.0) or 0.0),
-            "board": float(psu_all.get("board_w", 0.0) or 0.0),
-            "memory": float(psu_all.get("memory_w", 0.0) or 0.0),
-            "net": float(psu_all.get("net_w", 0.0) or 0.0),
-            "other": float(psu_all.get("other_w", 0.0) or 0.0),
+            "cpu": _safe_watts(psu_all.get("cpu_w")),
+            "gpu": _safe_watts(psu_all.get("gpu_w")),
+            "disk": _safe_watts(psu_all.get("disk_w")),
+            "board": _safe_watts(psu_all.get("board_w")),
+            "memory": _safe_watts(psu_all.get("memory_w")),
+            "net": _safe_watts(psu_all.get("net_w")),
+            "other": _safe_watts(psu_all.get("other_w")),
         }
         non_zero = [f"{k}={v:.2f}W" for k, v in cats.items() if v > 0.0]
         cat_txt = ", ".join(non_zero) if non_zero else "all=0W"
@@ -40,10 +225,9 @@ class MetricsMixin:
         if isinstance(src, dict) and src:
             pairs = []
             for name, value in src.items():
-                try:
-                    pairs.append((str(name), float(value)))
-                except Exception:
-                    continue
+                value = _safe_float(value, None)
+                if value is not None:
+                    pairs.append((str(name), value))
             pairs.sort(key=lambda x: x[1], reverse=True)
             top_txt = ", ".join([f"{n}={v:.2f}W" for n, v in pairs[:8]]) if pairs else "none"
 
@@ -56,10 +240,10 @@ class MetricsMixin:
         if not name:
             return "GPU"
         txt = str(name).strip()
-        txt = re.sub(r"\s*\(TM\)\s*", " ", txt, flags=re.IGNORECASE)
-        txt = re.sub(r"\s*\(R\)\s*", " ", txt, flags=re.IGNORECASE)
-        txt = re.sub(r"\s*\[[^\]]+\]\s*", " ", txt)
-        txt = re.sub(r"\s{2,}", " ", txt).strip(" -")
+        txt = _RE_TM.sub(" ", txt)
+        txt = _RE_R.sub(" ", txt)
+        txt = _RE_BRACKETS.sub(" ", txt)
+        txt = _RE_MULTISPACE.sub(" ", txt).strip(" -")
         low = txt.lower()
         # Common AMD Polaris ambiguous naming from PCI DB.
         if "rx 470/480/570/570x/580/580x/590" in low or "ellesmere" in low:
@@ -69,49 +253,16 @@ class MetricsMixin:
         return txt
 
     def _looks_like_storage_name(self, text):
-        if not text:
-            return False
-        low = text.lower()
-        storage_markers = (
-            "nvme",
-            "ssd",
-            "hdd",
-            "sata",
-            "wdc",
-            "sandisk",
-            "seagate",
-            "kingston",
-            "sdbpnpz",
-            "pc sn",
-            "disk",
-        )
-        return any(marker in low for marker in storage_markers)
+        return bool(text) and _RE_STORAGE.search(text) is not None
 
     def _metric_display_name(self, metric_name):
-        tr = self.lang_handler.tr
-        if metric_name == "cpu":
-            return tr("graph_cpu_load")
-        if metric_name == "ram":
-            return tr("gauge_ram")
-        if metric_name == "gpu":
-            return tr("graph_gpu_load")
-        if metric_name == "psu":
-            return tr("graph_psu_power")
-        if metric_name.startswith("gpu:"):
-            return tr("graph_gpu_load")
-        if metric_name == "net_total":
-            return tr("graph_net_total")
-        if metric_name == "cpu_temp":
-            return tr("graph_cpu_temp")
-        if metric_name == "gpu_temp":
-            return tr("graph_gpu_temp")
-        if metric_name.startswith("disk:"):
-            return tr("graph_disk_usage")
-        if metric_name.startswith("net:"):
-            return tr("graph_net_iface")
-        if metric_name.startswith("bt:"):
-            return tr("graph_bt_iface")
-        return metric_name
+        key = self._DISPLAY_KEYS.get(metric_name)
+        if key is None:
+            prefix, sep, _ = metric_name.partition(":")
+            key = self._PREFIX_DISPLAY_KEYS.get(prefix) if sep else None
+            if key is None:
+                return metric_name
+        return self.lang_handler.tr(key)
 
     def _metric_card_subtitle(self, metric_name):
         tr = self.lang_handler.tr
@@ -119,31 +270,45 @@ class MetricsMixin:
             return self.cpu_name or tr("card_subtitle_cpu")
         if metric_name == "ram":
             total_kb = self.latest_sensor_values.get("sys_mem_total_kb")
+            # Total RAM is static; reuse the formatted text while its inputs are unchanged.
+            key = (total_kb, self.lang_handler.current_lang)
+            memo = self._subtitle_memo.get("ram")
+            if memo is not None and memo[0] == key:
+                return memo[1]
             if total_kb:
-                return f"{(float(total_kb) / 1024.0 / 1024.0):.1f} GB"
-            return tr("card_subtitle_ram")
+                text = f"{(float(total_kb) / 1024.0 / 1024.0):.1f} GB"
+            else:
+                text = tr("card_subtitle_ram")
+            self._subtitle_memo["ram"] = (key, text)
+            return text
         if metric_name == "gpu":
             return self.gpu_name or tr("card_subtitle_gpu")
         if metric_name == "psu":
             mode = self.get_power_mode_resolved() if hasattr(self, "get_power_mode_resolved") else "auto"
             psu_all = self.latest_sensor_values.get("psu_all") or {}
             total_src = str(psu_all.get("source") or "").strip().lower()
+            key = (mode, total_src, self.lang_handler.current_lang)
+            memo = self._subtitle_memo.get("psu")
+            if memo is not None and memo[0] == key:
+                return memo[1]
             if mode == "laptop":
-                if total_src == "battery":
-                    return tr("power_subtitle_battery")
-                return tr("power_subtitle_laptop")
-            if mode == "desktop":
-                return tr("power_subtitle_desktop")
-            if total_src == "components":
-                return tr("power_subtitle_components")
-            if total_src == "battery":
-                return tr("power_subtitle_battery")
-            return tr("power_subtitle_auto")
+                text_key = "power_subtitle_battery" if total_src == "battery" else "power_subtitle_laptop"
+            elif mode == "desktop":
+                text_key = "power_subtitle_desktop"
+            elif total_src == "components":
+                text_key = "power_subtitle_components"
+            elif total_src == "battery":
+                text_key = "power_subtitle_battery"
+            else:
+                text_key = "power_subtitle_auto"
+            text = tr(text_key)
+            self._subtitle_memo["psu"] = (key, text)
+            return text
         if metric_name.startswith("gpu:"):
             gpu_id = metric_name.split(":", 1)[1]
-            for item in self.latest_sensor_values.get("gpu_all", []):
-                if item.get("id") == gpu_id:
-                    return item.get("name") or gpu_id
+            item = (self.latest_sensor_values.get("gpu_by_id") or _EMPTY_DICT).get(gpu_id)
+            if item is not None:
+                return item.get("name") or gpu_id
             return gpu_id
         if metric_name == "net_total":
             return tr("card_subtitle_net_total")
@@ -151,7 +316,7 @@ class MetricsMixin:
             return metric_name.split(":", 1)[1]
         if metric_name.startswith("net:"):
             iface = metric_name.split(":", 1)[1]
-            merge = (self.latest_sensor_values.get("net_bt_merge") or {}).get(iface, {})
+            merge = (self.latest_sensor_values.get("net_bt_merge") or _EMPTY_DICT).get(iface, _EMPTY_DICT)
             if merge.get("merged", False):
                 return f"{self._net_iface_kind(iface)} + BT ({iface})"
             return f"{self._net_iface_kind(iface)} ({iface})"
@@ -170,52 +335,39 @@ class MetricsMixin:
         return self._metric_device_info(metric_name)
 
     def _net_iface_kind(self, iface):
-        tr = self.lang_handler.tr
-        wireless_path = f"/sys/class/net/{iface}/wireless"
-        if os.path.isdir(wireless_path) or iface.startswith(("wl", "wlan")):
-            return tr("net_kind_wifi")
-        if iface.startswith(("ww", "wwan")):
-            return tr("net_kind_mobile")
-        if iface.startswith(("en", "eth", "eno", "enp")):
-            return tr("net_kind_ethernet")
-        return tr("net_kind_interface")
+        # Cache the translation key (not the text) so language switches need no invalidation.
+        key = self._iface_kind_cache.get(iface)
+        if key is None:
+            wireless_path = f"/sys/class/net/{iface}/wireless"
+            if os.path.isdir(wireless_path) or iface.startswith(("wl", "wlan")):
+                key = "net_kind_wifi"
+            elif iface.startswith(("ww", "wwan")):
+                key = "net_kind_mobile"
+            elif iface.startswith(("en", "eth", "eno", "enp")):
+                key = "net_kind_ethernet"
+            else:
+                key = "net_kind_interface"
+            self._iface_kind_cache[iface] = key
+        return self.lang_handler.tr(key)
 
     def _metric_accent(self, metric_name):
-        if metric_name == "cpu":
-            return "#42c7f5"
-        if metric_name == "ram":
-            return "#59d29b"
-        if metric_name == "gpu":
-            return "#f58f6a"
-        if metric_name == "psu":
-            return "#e9b44c"
-        if metric_name.startswith("gpu:"):
-            return "#f58f6a"
-        if metric_name == "cpu_temp":
-            return "#ffd166"
-        if metric_name == "gpu_temp":
-            return "#ff7b72"
-        if metric_name == "net_total":
-            return "#d38cff"
-        if metric_name.startswith("disk:"):
-            return "#8fb1ff"
-        if metric_name.startswith("net:"):
-            return "#c99dff"
-        if metric_name.startswith("bt:"):
-            return "#7cc4ff"
+        accent = self._ACCENTS.get(metric_name)
+        if accent is not None:
+            return accent
+        prefix, sep, _ = metric_name.partition(":")
+        if sep:
+            return self._PREFIX_ACCENTS.get(prefix, "#4ec9b0")
         return "#4ec9b0"
 
     def _metric_locked(self, metric_name):
-        if metric_name.startswith("disk:"):
-            return False
-        if metric_name.startswith("net:") or metric_name == "net_total":
-            return False
-        if metric_name.startswith("bt:"):
+        prefix, sep, _ = metric_name.partition(":")
+        if sep:
+            if prefix in self._UNLOCKED_PREFIXES:
+                return False
+            if prefix == "gpu":
+                return self.metric_locks.get("gpu", True)
+        elif metric_name in self._UNLOCKED_METRICS:
             return False
-        if metric_name == "psu":
-            return False
-        if metric_name.startswith("gpu:"):
-            return self.metric_locks.get("gpu", True)
         return self.metric_locks.get(metric_name, False)
 
     def _metric_device_info(self, metric_name):
@@ -234,9 +386,9 @@ class MetricsMixin:
             return self.lang_handler.tr("power_mode_auto")
         if metric_name.startswith("gpu:"):
             gpu_id = metric_name.split(":", 1)[1]
-            for item in self.latest_sensor_values.get("gpu_all", []):
-                if item.get("id") == gpu_id:
-                    return item.get("name") or gpu_id
+            item = (self.latest_sensor_values.get("gpu_by_id") or _EMPTY_DICT).get(gpu_id)
+            if item is not None:
+                return item.get("name") or gpu_id
             return gpu_id
         if metric_name == "net_total":
             return "Network"
@@ -260,21 +412,10 @@ class MetricsMixin:
         return "System"
 
     def _format_value(self, value, unit):
-        if unit == "%":
-            return f"{int(round(float(value)))}%"
-        if unit == "C":
-            return f"{float(value):.1f} C"
-        if unit == "Mbps":
-            v = float(value)
-            if v < 10.0:
-                return f"{v:.2f} Mbps"
-            return f"{v:.1f} Mbps"
-        if unit == "W":
-            v = float(value)
-            if v < 10.0:
-                return f"{v:.2f} W"
-            return f"{v:.1f} W"
-        return f"{float(value):.1f} {unit}"
+        formatter = self._FORMATTERS.get(unit)
+        if formatter is None:
+            return f"{float(value):.1f} {unit}"
+        return formatter(float(value))
 
     def _format_uptime(self, seconds):
         if seconds is None:
@@ -293,102 +434,70 @@ class MetricsMixin:
                 for line in f:
                     if line.lower().startswith("model name"):
                         model = line.split(":", 1)[1].strip()
-                        model = re.sub(r"\s*\(R\)\s*", " ", model, flags=re.IGNORECASE)
-                        model = re.sub(r"\s*\(TM\)\s*", " ", model, flags=re.IGNORECASE)
-                        model = re.sub(r"\s{2,}", " ", model).strip()
+                        model = _RE_R.sub(" ", model)
+                        model = _RE_TM.sub(" ", model)
+                        model = _RE_MULTISPACE.sub(" ", model).strip()
                         return model
         except Exception:
             pass
         if shutil.which("lscpu"):
-            try:
-                out = subprocess.check_output(
-                    ["sh", "-lc", "lscpu | grep -m1 'Model name:'"],
-                    text=True,
-                    stderr=subprocess.DEVNULL,
-                ).strip()
-                if ":" in out:
-                    return out.split(":", 1)[1].strip()
-            except Exception:
-                pass
+            line = _first_output_line(["lscpu"], _RE_LSCPU_MODEL)
+            if ":" in line:
+                return line.split(":", 1)[1].strip()
         return "CPU"
 
     def _detect_gpu_name(self):
-        # 1) Prefer runtime renderer string (usually closest to user-facing model name).
+        # 1) sysfs: driver-provided product name or PCI ID lookup, no process spawn.
+        for card in sorted(glob.glob("/sys/class/drm/card[0-9]*")):
+            val = _read_sysfs_text(os.path.join(card, "device", "product_name"))
+            if val and not self._looks_like_storage_name(val):
+                return self._normalize_gpu_name(val)
+            candidate = _pci_ids_lookup(
+                _read_sysfs_text(os.path.join(card, "device", "vendor")),
+                _read_sysfs_text(os.path.join(card, "device", "device")),
+            )
+            if candidate and not self._looks_like_storage_name(candidate):
+                return self._normalize_gpu_name(candidate)
+
+        # 2) Runtime renderer string (usually closest to user-facing model name).
         if shutil.which("glxinfo"):
-            try:
-                out = subprocess.check_output(
-                    ["sh", "-lc", "glxinfo -B 2>/dev/null | grep -m1 'OpenGL renderer string'"],
-                    text=True,
-                    stderr=subprocess.DEVNULL,
-                ).strip()
-                if ":" in out:
-                    candidate = out.split(":", 1)[1].strip()
-                    if candidate and not self._looks_like_storage_name(candidate):
-                        return self._normalize_gpu_name(candidate)
-            except Exception:
-                pass
+            line = _first_output_line(["glxinfo", "-B"], _RE_GLX_RENDERER)
+            if ":" in line:
+                candidate = line.split(":", 1)[1].strip()
+                if candidate and not self._looks_like_storage_name(candidate):
+                    return self._normalize_gpu_name(candidate)
 
         if shutil.which("vulkaninfo"):
-            try:
-                out = subprocess.check_output(
-                    ["sh", "-lc", "vulkaninfo --summary 2>/dev/null | grep -m1 'GPU id'"],
-                    text=True,
-                    stderr=subprocess.DEVNULL,
-                ).strip()
-                if ":" in out:
-                    candidate = out.split(":", 1)[1].strip()
-                    if candidate and not self._looks_like_storage_name(candidate):
-                        return self._normalize_gpu_name(candidate)
-            except Exception:
-                pass
-
-        # 2) PCI fallback
+            line = _first_output_line(["vulkaninfo", "--summary"], _RE_VK_GPU_ID)
+            if ":" in line:
+                candidate = line.split(":", 1)[1].strip()
+                if candidate and not self._looks_like_storage_name(candidate):
+                    return self._normalize_gpu_name(candidate)
+
+        # 3) PCI fallback
         if shutil.which("lspci"):
-            try:
-                out = subprocess.check_output(
-                    [
-                        "sh",
-                        "-lc",
-                        "lspci -nn | grep -E 'VGA compatible controller|3D controller|Display controller' | head -n1",
-                    ],
-                    text=True,
-                    stderr=subprocess.DEVNULL,
-                ).strip()
-                if out:
-                    if ": " in out:
-                        candidate = out.split(": ", 1)[1].strip()
-                    else:
-                        parts = out.split(" ", 1)
-                        candidate = parts[1].strip() if len(parts) > 1 else out
-                    if candidate and not self._looks_like_storage_name(candidate):
-                        return self._normalize_gpu_name(candidate)
-            except Exception:
-                pass
-
-        # 3) sysfs fallback
-        for card in sorted(glob.glob("/sys/class/drm/card[0-9]*")):
-            product = os.path.join(card, "device", "product_name")
-            if os.path.isfile(product):
-                try:
-                    val = open(product, "r", encoding="utf-8", errors="ignore").read().strip()
-                    if val and not self._looks_like_storage_name(val):
-                        return self._normalize_gpu_name(val)
-                except Exception:
-                    pass
+            out = _first_output_line(["lspci", "-nn"], _RE_PCI_DISPLAY)
+            if out:
+                if ": " in out:
+                    candidate = out.split(": ", 1)[1].strip()
+                else:
+                    parts = out.split(" ", 1)
+                    candidate = parts[1].strip() if len(parts) > 1 else out
+                if candidate and not self._looks_like_storage_name(candidate):
+                    return self._normalize_gpu_name(candidate)
         return "GPU"
 
     def _is_dynamic_metric(self, metric_name):
-        return metric_name.startswith("disk:") or metric_name.startswith("net:") or metric_name.startswith("bt:")
+        prefix, sep, _ = metric_name.partition(":")
+        return bool(sep) and prefix in self._DYNAMIC_PREFIXES
 
     def _is_value_active(self, metric_name, value):
         val = abs(float(value))
-        if metric_name.startswith("net:"):
-            return val >= 0.02
-        if metric_name.startswith("disk:"):
-            return val >= 0.3
-        if metric_name.startswith("bt:"):
-            return val >= 0.001
-        return val > 0.0
+        prefix, sep, _ = metric_name.partition(":")
+        threshold = self._ACTIVE_THRESHOLDS.get(prefix) if sep else None
+        if threshold is None:
+            return val > 0.0
+        return val >= threshold
 
     def _remove_metric_card(self, metric_name, fallback_metric):
         parts = self.metric_cards.get(metric_name)
@@ -398,6 +507,10 @@ class MetricsMixin:
         self.sidebar_layout.removeWidget(card)
         card.setParent(None)
         del self.metric_cards[metric_name]
+        self._card_titles.pop(metric_name, None)
+        self._card_subtitles.pop(metric_name, None)
+        self._card_values.pop(metric_name, None)
+        self._card_sparks.pop(metric_name, None)
         if hasattr(self, "_refresh_metric_separators"):
             self._refresh_metric_separators()
         if self.selected_metric == metric_name:
@@ -419,8 +532,8 @@ class MetricsMixin:
         parts["value"].setText(self._format_value(value, parts["unit"]))
 
         if self.selected_metric == metric_name:
-            self.primary_graph.data = list(parts["spark"].data)
-            self.primary_graph.recent_raw = list(parts["spark"].recent_raw)
+            self.primary_graph.data = parts["spark"].data
+            self.primary_graph.recent_raw = parts["spark"].recent_raw
             self.primary_graph.update()
             self._refresh_primary_info(metric_name)
 
@@ -442,8 +555,9 @@ class MetricsMixin:
         self.primary_graph.unit = parts["unit"]
         self.primary_graph.max_value = parts["max"]
         self.primary_graph.set_accent_color(parts.get("accent", "#4ec9b0"))
-        self.primary_graph.data = list(parts["spark"].data)
-        self.primary_graph.recent_raw = list(parts["spark"].recent_raw)
+        # Primary graph is display-only (never add_value), so it can read the card's buffers in place.
+        self.primary_graph.data = parts["spark"].data
+        self.primary_graph.recent_raw = parts["spark"].recent_raw
         self.primary_graph.set_blocked(
             self._metric_locked(metric_name),
             self.lang_handler.tr("graph_blocked_no_permissions"),
@@ -468,18 +582,29 @@ class MetricsMixin:
         for widget in self.cpu_core_graphs.values():
             widget.setParent(None)
         self.cpu_core_graphs.clear()
+        self._cpu_cores_dirty = True
+        self._cpu_core_order = None
 
     def _clear_power_sensor_graphs(self):
         for widget in self.power_sensor_graphs.values():
             widget.setParent(None)
         self.power_sensor_graphs.clear()
+        self._power_sensors_dirty = True
+        self._power_sensor_order = None
 
     def _clear_detail_layout(self):
+        # Graph widgets are reused by the next render, so detach rather than delete them.
+        # Disabling the layout meanwhile collapses N geometry updates into one.
+        self.cpu_cores_layout.setEnabled(False)
         while self.cpu_cores_layout.count():
             item = self.cpu_cores_layout.takeAt(0)
             widget = item.widget()
             if widget:
                 widget.setParent(None)
+        self.cpu_cores_layout.setEnabled(True)
+        # The grid is shared by CPU and Power views; both must be re-laid out next time.
+        self._cpu_cores_dirty = True
+        self._power_sensors_dirty = True
 
     def _power_sensor_accent(self, name):
         low = str(name or "").lower()
@@ -496,39 +621,42 @@ class MetricsMixin:
         return "#4ec9b0"
 
     def _render_cpu_core_graphs(self):
+        if not self._cpu_cores_dirty:
+            return
         self._clear_detail_layout()
+        if self._cpu_core_order is None:
+            self._cpu_core_order = sorted(self.cpu_core_graphs.keys(), key=_core_sort_key)
         cols = 4
         idx = 0
-        for core_name in sorted(
-            self.cpu_core_graphs.keys(),
-            key=lambda n: int(n[3:]) if n.startswith("cpu") and n[3:].isdigit() else n,
-        ):
+        for core_name in self._cpu_core_order:
             row = idx // cols
             col = idx % cols
             self.cpu_cores_layout.addWidget(self.cpu_core_graphs[core_name], row, col)
             idx += 1
+        self._cpu_cores_dirty = False
+        self._cpu_render_last_ts = time.time()
 
     def _render_power_sensor_graphs(self):
+        if not self._power_sensors_dirty:
+            return
         self._clear_detail_layout()
+        if self._power_sensor_order is None:
+            self._power_sensor_order = sorted(self.power_sensor_graphs.keys())
         cols = 2
         idx = 0
-        for sensor_name in sorted(self.power_sensor_graphs.keys()):
+        for sensor_name in self._power_sensor_order:
             row = idx // cols
             col = idx % cols
             self.cpu_cores_layout.addWidget(self.power_sensor_graphs[sensor_name], row, col)
             idx += 1
+        self._power_sensors_dirty = False
+        self._power_render_last_ts = time.time()
 
     def _update_cpu_core_graphs(self, core_usage):
         if not isinstance(core_usage, list):
             return
-        incoming_names = [str(item.get("name")) for item in core_usage if isinstance(item, dict) and item.get("name")]
-        incoming_set = set(incoming_names)
-        existing_set = set(self.cpu_core_graphs.keys())
-
-        for name in list(existing_set - incoming_set):
-            widget = self.cpu_core_graphs.pop(name)
-            widget.setParent(None)
-
+        # Single pass: whatever is left in `remaining` afterwards is stale.
+        remaining = dict(self.cpu_core_graphs)
         for item in core_usage:
             if not isinstance(item, dict):
                 continue
@@ -537,7 +665,7 @@ class MetricsMixin:
                 continue
             usage = float(item.get("usage", 0.0))
 
-            graph = self.cpu_core_graphs.get(core_name)
+            graph = remaining.pop(core_name, None) or self.cpu_core_graphs.get(core_name)
             if graph is None:
                 graph = GraphWidget(label=core_name, unit="%", max_value=100.0, peak_window=1, max_points=40)
                 graph.setMinimumHeight(64)
@@ -546,41 +674,52 @@ class MetricsMixin:
                 graph.set_accent_color("#42c7f5")
                 graph.update_theme(self._theme_is_dark())
                 self.cpu_core_graphs[core_name] = graph
+                self._cpu_cores_dirty = True
+                self._cpu_core_order = None
             graph.add_value(usage)
 
-        if self.selected_metric == "cpu":
-            self._render_cpu_core_graphs()
+        for stale in remaining:
+            widget = self.cpu_core_graphs.pop(stale)
+            widget.hide()
+            widget.deleteLater()
+            self._cpu_cores_dirty = True
+            self._cpu_core_order = None
+
+        # Coalesce grid rebuilds while cores hotplug; explicit selection renders immediately.
+        if self.selected_metric == "cpu" and self._cpu_cores_dirty:
+            if (time.time() - self._cpu_render_last_ts) >= 0.5:
+                self._render_cpu_core_graphs()
+
+    def _get_power_category_defs(self):
+        # Translated once per language; retranslate_ui() drops the cache.
+        if self._power_category_defs is None:
+            tr = self.lang_handler.tr
+            self._power_category_defs = (
+                ("cat:cpu", tr("details_power_cpu"), "cpu_w"),
+                ("cat:gpu", tr("details_power_gpu"), "gpu_w"),
+                ("cat:disk", tr("details_power_disk"), "disk_w"),
+                ("cat:board", tr("details_power_board"), "board_w"),
+                ("cat:memory", tr("details_power_memory"), "memory_w"),
+                ("cat:net", tr("details_power_net"), "net_w"),
+                ("cat:other", tr("details_power_other"), "other_w"),
+            )
+        return self._power_category_defs
 
     def _update_power_sensor_graphs(self, psu_all):
         if not isinstance(psu_all, dict):
             return
-        tr = self.lang_handler.tr
         incoming = {}
 
         # Always-visible category totals so CPU/board/disk are present in the Power tab.
-        category_defs = [
-            ("cat:cpu", tr("details_power_cpu"), "cpu_w"),
-            ("cat:gpu", tr("details_power_gpu"), "gpu_w"),
-            ("cat:disk", tr("details_power_disk"), "disk_w"),
-            ("cat:board", tr("details_power_board"), "board_w"),
-            ("cat:memory", tr("details_power_memory"), "memory_w"),
-            ("cat:net", tr("details_power_net"), "net_w"),
-            ("cat:other", tr("details_power_other"), "other_w"),
-        ]
-        for key, label, src_key in category_defs:
-            try:
-                watts = max(0.0, float(psu_all.get(src_key, 0.0)))
-            except Exception:
-                watts = 0.0
-            incoming[key] = {"label": label, "watts": watts}
+        for key, label, src_key in self._get_power_category_defs():
+            incoming[key] = {"label": label, "watts": _safe_watts(psu_all.get(src_key))}
 
         # Raw sensor channels from kernel/sysfs as extra detailed plots.
         sources = psu_all.get("sources") or {}
         if isinstance(sources, dict):
             for src_name, value in sources.items():
-                try:
-                    watts = max(0.0, float(value))
-                except Exception:
+                watts = _safe_watts(value, None)
+                if watts is None:
                     continue
                 sensor_key = f"sensor:{src_name}"
                 incoming[sensor_key] = {"label": str(src_name), "watts": watts, "blocked": False}
@@ -597,18 +736,13 @@ class MetricsMixin:
                     continue
                 incoming[sensor_key] = {"label": name, "watts": 0.0, "blocked": True}
 
-        existing = set(self.power_sensor_graphs.keys())
-        incoming_set = set(incoming.keys())
-        for removed in list(existing - incoming_set):
-            widget = self.power_sensor_graphs.pop(removed)
-            widget.setParent(None)
-
+        remaining = dict(self.power_sensor_graphs)
         for sensor_name in sorted(incoming.keys()):
             payload = incoming[sensor_name]
             label = str(payload.get("label", sensor_name))
             watts = float(payload.get("watts", 0.0))
             is_blocked = bool(payload.get("blocked", False))
-            graph = self.power_sensor_graphs.get(sensor_name)
+            graph = remaining.pop(sensor_name, None)
             if graph is None:
                 graph = GraphWidget(label=label, unit="W", max_value=None, peak_window=2, max_points=50)
                 graph.setMinimumHeight(80)
@@ -617,14 +751,222 @@ class MetricsMixin:
                 graph.set_accent_color(self._power_sensor_accent(label))
                 graph.update_theme(self._theme_is_dark())
                 self.power_sensor_graphs[sensor_name] = graph
+                self._power_sensors_dirty = True
+                self._power_sensor_order = None
             else:
                 graph.label = label
             graph.set_blocked(is_blocked, self.lang_handler.tr("metric_password_required"))
             if not is_blocked:
                 graph.add_value(watts)
 
-        if self.selected_metric == "psu":
-            self._render_power_sensor_graphs()
+        for stale in remaining:
+            widget = self.power_sensor_graphs.pop(stale)
+            widget.hide()
+            widget.deleteLater()
+            self._power_sensors_dirty = True
+            self._power_sensor_order = None
+
+        if self.selected_metric == "psu" and self._power_sensors_dirty:
+            if (time.time() - self._power_render_last_ts) >= 0.5:
+                self._render_power_sensor_graphs()
+
+    def _info_cpu(self, metric_name, left_lines, right_lines, advanced, tr):
+        lsv = self.latest_sensor_values
+        fmt = self._format_value
+        append_l = left_lines.append
+        append_r = right_lines.append
+        cpu_temp = lsv.get("cpu_temp")
+        cpu_temp_text = (
+            tr("graph_blocked_no_permissions")
+            if self.metric_locks.get("cpu_temp", True)
+            else (fmt(cpu_temp, "C") if cpu_temp is not None else tr("details_not_available"))
+        )
+        append_r(f"{tr('details_cpu_temp')}: {cpu_temp_text}")
+        cpu_vendor = lsv.get("sys_cpu_vendor")
+        cpu_packages = lsv.get("sys_cpu_packages")
+        if cpu_vendor:
+            if advanced:
+                append_r(f"{tr('details_cpu_vendor')}: {cpu_vendor}")
+        if cpu_packages is not None:
+            if advanced:
+                append_r(f"{tr('details_cpu_packages')}: {cpu_packages}")
+
+        append_l(f"{tr('details_uptime')}: {self._format_uptime(lsv.get('sys_uptime_s'))}")
+        processes = lsv.get("sys_processes_total")
+        running = lsv.get("sys_procs_running")
+        blocked = lsv.get("sys_procs_blocked")
+        cpu_count = lsv.get("sys_cpu_count")
+        load_1m = lsv.get("sys_load_1m")
+        load_5m = lsv.get("sys_load_5m")
+        load_15m = lsv.get("sys_load_15m")
+
+        if advanced and processes is not None:
+            append_l(f"{tr('details_processes')}: {processes}")
+        if advanced and running is not None:
+            append_l(f"{tr('details_running')}: {running}")
+        if advanced and blocked is not None:
+            append_l(f"{tr('details_blocked')}: {blocked}")
+        if cpu_count is not None:
+            append_l(f"{tr('details_cpu_count')}: {cpu_count}")
+        if advanced and load_1m is not None and load_5m is not None and load_15m is not None:
+            append_r(
+                f"{tr('details_loadavg')}: {load_1m:.2f} / {load_5m:.2f} / {load_15m:.2f}"
+            )
+        # Intentionally omitted: per-core "top usage" text is noisy when
+        # dedicated per-core graphs are visible in CPU tab.
+
+    def _info_gpu(self, metric_name, left_lines, right_lines, advanced, tr):
+        lsv = self.latest_sensor_values
+        append_r = right_lines.append
+        gpu_temp = lsv.get("gpu_temp")
+        gpu_item = None
+        if metric_name != "gpu":
+            gpu_id = metric_name.split(":", 1)[1]
+            gpu_item = (lsv.get("gpu_by_id") or _EMPTY_DICT).get(gpu_id)
+            if gpu_item is not None:
+                gpu_temp = gpu_item.get("temp")
+        elif lsv.get("gpu_all"):
+            gpu_item = lsv.get("gpu_all")[0]
+        gpu_temp_text = (
+            tr("graph_blocked_no_permissions")
+            if self.metric_locks.get("gpu_temp", True)
+            else (self._format_value(gpu_temp, "C") if gpu_temp is not None else tr("details_not_available"))
+        )
+        append_r(f"{tr('details_gpu_temp')}: {gpu_temp_text}")
+        if gpu_item:
+            gpu_driver = str(gpu_item.get("driver") or "").strip()
+            gpu_slot = str(gpu_item.get("slot") or "").strip()
+            gpu_vid = str(gpu_item.get("vendor_id") or "").strip()
+            gpu_did = str(gpu_item.get("device_id") or "").strip()
+            if advanced and gpu_driver:
+                append_r(f"{tr('details_gpu_driver')}: {gpu_driver}")
+            if advanced and gpu_slot:
+                append_r(f"{tr('details_gpu_slot')}: {gpu_slot}")
+            if advanced and (gpu_vid or gpu_did):
+                append_r(f"{tr('details_gpu_pci_id')}: {gpu_vid} {gpu_did}".strip())
+
+        left_lines.append(f"{tr('details_uptime')}: {self._format_uptime(lsv.get('sys_uptime_s'))}")
+        if metric_name == "gpu":
+            gpu_all = lsv.get("gpu_all") or []
+            if gpu_all:
+                append_r(f"{tr('details_gpus_count')}: {len(gpu_all)}")
+
+    def _info_ram(self, metric_name, left_lines, right_lines, advanced, tr):
+        lsv = self.latest_sensor_values
+        append_r = right_lines.append
+        mem_total_kb = lsv.get("sys_mem_total_kb")
+        mem_available_kb = lsv.get("sys_mem_available_kb")
+        swap_total_kb = lsv.get("sys_swap_total_kb")
+        swap_free_kb = lsv.get("sys_swap_free_kb")
+        if mem_total_kb is not None and mem_available_kb is not None and mem_total_kb > 0:
+            used_kb = max(0, mem_total_kb - mem_available_kb)
+            used_gb = float(used_kb) / 1024.0 / 1024.0
+            total_gb = float(mem_total_kb) / 1024.0 / 1024.0
+            mem_pct = (used_kb / float(mem_total_kb)) * 100.0
+            append_r(f"{tr('details_mem_used')}: {used_gb:.1f}/{total_gb:.1f} GB ({mem_pct:.0f}%)")
+        if advanced and swap_total_kb is not None and swap_free_kb is not None and swap_total_kb > 0:
+            swap_used_kb = max(0, swap_total_kb - swap_free_kb)
+            swap_used_gb = float(swap_used_kb) / 1024.0 / 1024.0
+            swap_total_gb = float(swap_total_kb) / 1024.0 / 1024.0
+            append_r(f"{tr('details_swap_used')}: {swap_used_gb:.1f}/{swap_total_gb:.1f} GB")
+        left_lines.append(f"{tr('details_uptime')}: {self._format_uptime(lsv.get('sys_uptime_s'))}")
+
+    def _info_psu(self, metric_name, left_lines, right_lines, advanced, tr):
+        psu_all = self.latest_sensor_values.get("psu_all") or {}
+        if not isinstance(psu_all, dict):
+            return
+        fmt = self._format_value
+        append_r = right_lines.append
+        has_battery = bool(psu_all.get("has_battery", False))
+        ac_online = bool(psu_all.get("ac_online", False))
+        source = str(psu_all.get("source") or "none")
+        mode_text = tr(f"power_mode_{self.get_power_mode_resolved()}")
+        ac_text = tr("details_yes") if ac_online else tr("details_no")
+        append_r(f"{tr('details_power_mode')}: {mode_text}")
+        append_r(f"{tr('details_power_source')}: {source}")
+        append_r(f"{tr('details_power_ac')}: {ac_text}")
+        for key, lbl in _PSU_POWER_KEYS:
+            value = _safe_float(psu_all.get(key), 0.0)
+            if value > 0.0:
+                append_r(f"{tr(lbl)}: {fmt(value, 'W')}")
+        if has_battery:
+            cap = _safe_float(psu_all.get("battery_capacity_avg"), None)
+            if cap is not None:
+                append_r(f"{tr('details_battery_level')}: {cap:.0f}%")
+            batt_w = _safe_float(psu_all.get("battery_total_w"), None)
+            if batt_w is not None:
+                append_r(f"{tr('details_battery_power')}: {fmt(batt_w, 'W')}")
+        sources = psu_all.get("sources")
+        if advanced and isinstance(sources, dict) and sources:
+            pairs = []
+            for k, v in sources.items():
+                v = _safe_float(v, None)
+                if v is not None:
+                    pairs.append((str(k), v))
+            pairs.sort(key=lambda x: x[1], reverse=True)
+            if pairs:
+                append_r(f"{tr('details_power_channels')}:")
+                for name, watts in pairs[:24]:
+                    append_r(f"{name}: {fmt(watts, 'W')}")
+
+    def _info_net(self, metric_name, left_lines, right_lines, advanced, tr):
+        lsv = self.latest_sensor_values
+        fmt = self._format_value
+        append_r = right_lines.append
+        rx = fmt(lsv.get("net_rx", 0.0), "Mbps")
+        tx = fmt(lsv.get("net_tx", 0.0), "Mbps")
+        append_r(f"{tr('details_net_rx')}: {rx}")
+        append_r(f"{tr('details_net_tx')}: {tx}")
+        if metric_name != "net_total":
+            iface = metric_name.split(":", 1)[1]
+            merge = (lsv.get("net_bt_merge") or _EMPTY_DICT).get(iface, _EMPTY_DICT)
+            if merge.get("merged", False):
+                bt_rx = fmt(float(merge.get("bt_rx_mbps", 0.0)), "Mbps")
+                bt_tx = fmt(float(merge.get("bt_tx_mbps", 0.0)), "Mbps")
+                append_r(f"{tr('details_bt_rx')}: {bt_rx}")
+                append_r(f"{tr('details_bt_tx')}: {bt_tx}")
+                names = ", ".join(merge.get("adapters", [])[:3])
+                if names:
+                    append_r(f"{tr('details_bt_adapters')}: {names}")
+
+    def _info_bt(self, metric_name, left_lines, right_lines, advanced, tr):
+        fmt = self._format_value
+        append_r = right_lines.append
+        adapter = metric_name.split(":", 1)[1]
+        bt_all = self.latest_sensor_values.get("bt_all")
+        item = bt_all.get(adapter) if isinstance(bt_all, dict) else None
+        if not isinstance(item, dict):
+            item = _EMPTY_DICT
+        rx = fmt(float(item.get("rx_mbps", 0.0)), "Mbps")
+        tx = fmt(float(item.get("tx_mbps", 0.0)), "Mbps")
+        append_r(f"{tr('details_bt_rx')}: {rx}")
+        append_r(f"{tr('details_bt_tx')}: {tx}")
+        address = str(item.get("address") or "").strip()
+        if advanced and address:
+            append_r(f"{tr('details_bt_address')}: {address}")
+        driver = str(item.get("driver") or "").strip()
+        if advanced and driver:
+            append_r(f"{tr('details_bt_driver')}: {driver}")
+        chipset = str(item.get("chipset") or "").strip()
+        if advanced and chipset:
+            append_r(f"{tr('details_bt_chipset')}: {chipset}")
+        rfkill = item.get("rfkill_blocked", None)
+        if advanced and (rfkill is True or rfkill is False):
+            state_text = tr("details_bt_state_blocked") if rfkill else tr("details_bt_state_on")
+            append_r(f"{tr('details_bt_rfkill')}: {state_text}")
+        conn = item.get("connected_devices", None)
+        if conn is not None:
+            append_r(f"{tr('details_bt_connected')}: {int(conn)}")
+
+    # Detail-panel builders; "disk:" cards only show the common lines.
+    _INFO_HANDLERS = {
+        "cpu": _info_cpu,
+        "gpu": _info_gpu,
+        "ram": _info_ram,
+        "psu": _info_psu,
+        "net_total": _info_net,
+    }
+    _PREFIX_INFO_HANDLERS = {"gpu": _info_gpu, "net": _info_net, "bt": _info_bt}
 
     def _refresh_primary_info(self, metric_name):
         tr = self.lang_handler.tr
@@ -634,7 +976,7 @@ class MetricsMixin:
         advanced = bool(getattr(self, "advanced_details_enabled", True))
 
         if not parts.get("seen", False):
-            current_value = self.lang_handler.tr("value_na")
+            current_value = tr("value_na")
         else:
             current_value = parts["value"].text()
         status = tr("graph_blocked_no_permissions") if self._metric_locked(metric_name) else tr("details_live")
@@ -653,213 +995,50 @@ class MetricsMixin:
             f"{tr('details_source_label')}: {self._metric_device_info(metric_name)}",
         ]
 
-        if metric_name == "cpu":
-            cpu_temp = self.latest_sensor_values.get("cpu_temp")
-            cpu_temp_text = (
-                tr("graph_blocked_no_permissions")
-                if self.metric_locks.get("cpu_temp", True)
-                else (self._format_value(cpu_temp, "C") if cpu_temp is not None else tr("details_not_available"))
-            )
-            right_lines.append(f"{tr('details_cpu_temp')}: {cpu_temp_text}")
-            cpu_vendor = self.latest_sensor_values.get("sys_cpu_vendor")
-            cpu_packages = self.latest_sensor_values.get("sys_cpu_packages")
-            if cpu_vendor:
-                if advanced:
-                    right_lines.append(f"{tr('details_cpu_vendor')}: {cpu_vendor}")
-            if cpu_packages is not None:
-                if advanced:
-                    right_lines.append(f"{tr('details_cpu_packages')}: {cpu_packages}")
-        elif metric_name == "gpu" or metric_name.startswith("gpu:"):
-            gpu_temp = self.latest_sensor_values.get("gpu_temp")
-            gpu_item = None
-            if metric_name.startswith("gpu:"):
-                gpu_id = metric_name.split(":", 1)[1]
-                for item in self.latest_sensor_values.get("gpu_all", []):
-                    if item.get("id") == gpu_id:
-                        gpu_item = item
-                        gpu_temp = item.get("temp")
-                        break
-            elif self.latest_sensor_values.get("gpu_all"):
-                gpu_item = self.latest_sensor_values.get("gpu_all")[0]
-            gpu_temp_text = (
-                tr("graph_blocked_no_permissions")
-                if self.metric_locks.get("gpu_temp", True)
-                else (self._format_value(gpu_temp, "C") if gpu_temp is not None else tr("details_not_available"))
-            )
-            right_lines.append(f"{tr('details_gpu_temp')}: {gpu_temp_text}")
-            if gpu_item:
-                gpu_driver = str(gpu_item.get("driver") or "").strip()
-                gpu_slot = str(gpu_item.get("slot") or "").strip()
-                gpu_vid = str(gpu_item.get("vendor_id") or "").strip()
-                gpu_did = str(gpu_item.get("device_id") or "").strip()
-                if advanced and gpu_driver:
-                    right_lines.append(f"{tr('details_gpu_driver')}: {gpu_driver}")
-                if advanced and gpu_slot:
-                    right_lines.append(f"{tr('details_gpu_slot')}: {gpu_slot}")
-                if advanced and (gpu_vid or gpu_did):
-                    right_lines.append(f"{tr('details_gpu_pci_id')}: {gpu_vid} {gpu_did}".strip())
-        elif metric_name == "ram":
-            mem_total_kb = self.latest_sensor_values.get("sys_mem_total_kb")
-            mem_available_kb = self.latest_sensor_values.get("sys_mem_available_kb")
-            swap_total_kb = self.latest_sensor_values.get("sys_swap_total_kb")
-            swap_free_kb = self.latest_sensor_values.get("sys_swap_free_kb")
-            if mem_total_kb is not None and mem_available_kb is not None and mem_total_kb > 0:
-                used_kb = max(0, mem_total_kb - mem_available_kb)
-                used_gb = float(used_kb) / 1024.0 / 1024.0
-                total_gb = float(mem_total_kb) / 1024.0 / 1024.0
-                mem_pct = (used_kb / float(mem_total_kb)) * 100.0
-                right_lines.append(f"{tr('details_mem_used')}: {used_gb:.1f}/{total_gb:.1f} GB ({mem_pct:.0f}%)")
-            if advanced and swap_total_kb is not None and swap_free_kb is not None and swap_total_kb > 0:
-                swap_used_kb = max(0, swap_total_kb - swap_free_kb)
-                swap_used_gb = float(swap_used_kb) / 1024.0 / 1024.0
-                swap_total_gb = float(swap_total_kb) / 1024.0 / 1024.0
-                right_lines.append(f"{tr('details_swap_used')}: {swap_used_gb:.1f}/{swap_total_gb:.1f} GB")
-        elif metric_name == "psu":
-            psu_all = self.latest_sensor_values.get("psu_all") or {}
-            if isinstance(psu_all, dict):
-                has_battery = bool(psu_all.get("has_battery", False))
-                ac_online = bool(psu_all.get("ac_online", False))
-                source = str(psu_all.get("source") or "none")
-                right_lines.append(f"{tr('details_power_mode')}: {self.lang_handler.tr(f'power_mode_{self.get_power_mode_resolved()}')}")
-                right_lines.append(f"{tr('details_power_source')}: {source}")
-                right_lines.append(f"{tr('details_power_ac')}: {tr('details_yes') if ac_online else tr('details_no')}")
-                for key, lbl in (
-                    ("cpu_w", "details_power_cpu"),
-                    ("gpu_w", "details_power_gpu"),
-                    ("disk_w", "details_power_disk"),
-                    ("net_w", "details_power_net"),
-                    ("board_w", "details_power_board"),
-                    ("memory_w", "details_power_memory"),
-                    ("other_w", "details_power_other"),
-                ):
-                    try:
-                        value = float(psu_all.get(key, 0.0))
-                    except Exception:
-                        value = 0.0
-                    if value > 0.0:
-                        right_lines.append(f"{tr(lbl)}: {self._format_value(value, 'W')}")
-                if has_battery:
-                    cap = psu_all.get("battery_capacity_avg")
-                    if cap is not None:
-                        try:
-                            right_lines.append(f"{tr('details_battery_level')}: {float(cap):.0f}%")
-                        except Exception:
-                            pass
-                    batt_w = psu_all.get("battery_total_w")
-                    if batt_w is not None:
-                        try:
-                            right_lines.append(f"{tr('details_battery_power')}: {self._format_value(float(batt_w), 'W')}")
-                        except Exception:
-                            pass
-                sources = psu_all.get("sources")
-                if advanced and isinstance(sources, dict) and sources:
-                    pairs = []
-                    for k, v in sources.items():
-                        try:
-                            pairs.append((str(k), float(v)))
-                        except Exception:
-                            continue
-                    pairs.sort(key=lambda x: x[1], reverse=True)
-                    if pairs:
-                        right_lines.append(f"{tr('details_power_channels')}:")
-                        for name, watts in pairs[:24]:
-                            right_lines.append(f"{name}: {self._format_value(watts, 'W')}")
-        elif metric_name == "net_total" or metric_name.startswith("net:"):
-            rx = self._format_value(self.latest_sensor_values.get("net_rx", 0.0), "Mbps")
-            tx = self._format_value(self.latest_sensor_values.get("net_tx", 0.0), "Mbps")
-            right_lines.append(f"{tr('details_net_rx')}: {rx}")
-            right_lines.append(f"{tr('details_net_tx')}: {tx}")
-            if metric_name.startswith("net:"):
-                iface = metric_name.split(":", 1)[1]
-                merge = (self.latest_sensor_values.get("net_bt_merge") or {}).get(iface, {})
-                if merge.get("merged", False):
-                    bt_rx = self._format_value(float(merge.get("bt_rx_mbps", 0.0)), "Mbps")
-                    bt_tx = self._format_value(float(merge.get("bt_tx_mbps", 0.0)), "Mbps")
-                    right_lines.append(f"{tr('details_bt_rx')}: {bt_rx}")
-                    right_lines.append(f"{tr('details_bt_tx')}: {bt_tx}")
-                    names = ", ".join(merge.get("adapters", [])[:3])
-                    if names:
-                        right_lines.append(f"{tr('details_bt_adapters')}: {names}")
-        elif metric_name.startswith("bt:"):
-            adapter = metric_name.split(":", 1)[1]
-            bt_all = self.latest_sensor_values.get("bt_all") or {}
-            item = bt_all.get(adapter) if isinstance(bt_all, dict) else {}
-            rx = self._format_value(float((item or {}).get("rx_mbps", 0.0)), "Mbps")
-            tx = self._format_value(float((item or {}).get("tx_mbps", 0.0)), "Mbps")
-            right_lines.append(f"{tr('details_bt_rx')}: {rx}")
-            right_lines.append(f"{tr('details_bt_tx')}: {tx}")
-            address = str((item or {}).get("address") or "").strip()
-            if advanced and address:
-                right_lines.append(f"{tr('details_bt_address')}: {address}")
-            driver = str((item or {}).get("driver") or "").strip()
-            if advanced and driver:
-                right_lines.append(f"{tr('details_bt_driver')}: {driver}")
-            chipset = str((item or {}).get("chipset") or "").strip()
-            if advanced and chipset:
-                right_lines.append(f"{tr('details_bt_chipset')}: {chipset}")
-            rfkill = (item or {}).get("rfkill_blocked", None)
-            if advanced and rfkill is True:
-                right_lines.append(f"{tr('details_bt_rfkill')}: {tr('details_bt_state_blocked')}")
-            elif advanced and rfkill is False:
-                right_lines.append(f"{tr('details_bt_rfkill')}: {tr('details_bt_state_on')}")
-            conn = (item or {}).get("connected_devices", None)
-            if conn is not None:
-                right_lines.append(f"{tr('details_bt_connected')}: {int(conn)}")
-
-        uptime_s = self.latest_sensor_values.get("sys_uptime_s")
-        if metric_name in ("cpu", "ram", "gpu"):
-            left_lines.append(f"{tr('details_uptime')}: {self._format_uptime(uptime_s)}")
-        elif metric_name.startswith("gpu:"):
-            left_lines.append(f"{tr('details_uptime')}: {self._format_uptime(uptime_s)}")
-
-        if metric_name == "cpu":
-            processes = self.latest_sensor_values.get("sys_processes_total")
-            running = self.latest_sensor_values.get("sys_procs_running")
-            blocked = self.latest_sensor_values.get("sys_procs_blocked")
-            cpu_count = self.latest_sensor_values.get("sys_cpu_count")
-            load_1m = self.latest_sensor_values.get("sys_load_1m")
-            load_5m = self.latest_sensor_values.get("sys_load_5m")
-            load_15m = self.latest_sensor_values.get("sys_load_15m")
-
-            if advanced and processes is not None:
-                left_lines.append(f"{tr('details_processes')}: {processes}")
-            if advanced and running is not None:
-                left_lines.append(f"{tr('details_running')}: {running}")
-            if advanced and blocked is not None:
-                left_lines.append(f"{tr('details_blocked')}: {blocked}")
-            if cpu_count is not None:
-                left_lines.append(f"{tr('details_cpu_count')}: {cpu_count}")
-            if advanced and load_1m is not None and load_5m is not None and load_15m is not None:
-                right_lines.append(
-                    f"{tr('details_loadavg')}: {load_1m:.2f} / {load_5m:.2f} / {load_15m:.2f}"
-                )
-            # Intentionally omitted: per-core "top usage" text is noisy when
-            # dedicated per-core graphs are visible in CPU tab.
-
-        if metric_name == "gpu":
-            gpu_all = self.latest_sensor_values.get("gpu_all") or []
-            if gpu_all:
-                right_lines.append(f"{tr('details_gpus_count')}: {len(gpu_all)}")
+        handler = self._INFO_HANDLERS.get(metric_name)
+        if handler is None:
+            prefix, sep, _ = metric_name.partition(":")
+            handler = self._PREFIX_INFO_HANDLERS.get(prefix) if sep else None
+        if handler is not None:
+            handler(self, metric_name, left_lines, right_lines, advanced, tr)
 
+        # Skip Qt relayout when the rendered text would be identical.
+        sig = (metric_name, tuple(left_lines), tuple(right_lines))
+        if sig == self._last_info_sig:
+            return
+        self._last_info_sig = sig
         self.info_left.setText("\n".join(left_lines))
         self.info_right.setText("\n".join(right_lines))
 
     def update_widgets(self, data):
         now = time.time()
+        lsv = self.latest_sensor_values
+        cards = self.metric_cards
+        seen_map = self.metric_last_seen
+        active_map = self.metric_last_active
+        hidden = self.dynamic_metric_hidden
+        locks = self.metric_locks
+        set_val = self._set_metric_value
+        add_card = self._add_metric_card
+        value_active = self._is_value_active
+        # One snapshot of card names per tick; removals below are idempotent and
+        # cards added during this tick are fresh, so the snapshot stays valid.
+        all_names = list(cards)
+        gpu_names = [name for name in all_names if name[:4] == "gpu:"]
         can_rebuild_dynamic = (now - float(getattr(self, "_dynamic_last_rebuild_ts", 0.0))) >= float(
             getattr(self, "dynamic_rebuild_interval_s", 1.0)
         )
         if "cpu" in data:
-            self._set_metric_value("cpu", float(data["cpu"]))
+            set_val("cpu", float(data["cpu"]))
 
         if "ram" in data:
-            self._set_metric_value("ram", float(data["ram"]))
+            set_val("ram", float(data["ram"]))
 
         if "psu" in data:
-            self._set_metric_value("psu", float(data["psu"]))
+            set_val("psu", float(data["psu"]))
         psu_all = data.get("psu_all")
         if isinstance(psu_all, dict):
-            self.latest_sensor_values["psu_all"] = psu_all
+            lsv["psu_all"] = psu_all
             if hasattr(self, "_update_auto_power_profile"):
                 self._update_auto_power_profile(psu_all)
             self._update_power_sensor_graphs(psu_all)
@@ -868,17 +1047,26 @@ class MetricsMixin:
 
         gpu_all = data.get("gpu_all")
         if isinstance(gpu_all, list):
-            self.latest_sensor_values["gpu_all"] = gpu_all
+            lsv["gpu_all"] = gpu_all
             valid_gpus = [item for item in gpu_all if isinstance(item, dict) and item.get("id")]
-            telemetry_gpus = []
+            gpu_by_id = {}
             for item in valid_gpus:
-                load = item.get("load")
-                temp = item.get("temp")
-                has_load = load is not None and self._is_value_active("gpu", load)
-                has_temp = temp is not None and float(temp) > 0.0
-                if has_load or has_temp:
-                    telemetry_gpus.append(item)
-            has_multi_gpu = len(telemetry_gpus) > 1
+                gpu_by_id.setdefault(item["id"], item)
+            lsv["gpu_by_id"] = gpu_by_id
+            if len(valid_gpus) < 2:
+                # Common single-GPU install: no per-GPU cards, nothing to filter.
+                telemetry_gpus = valid_gpus
+                has_multi_gpu = False
+            else:
+                telemetry_gpus = []
+                for item in valid_gpus:
+                    load = item.get("load")
+                    temp = item.get("temp")
+                    has_load = load is not None and value_active("gpu", load)
+                    has_temp = temp is not None and float(temp) > 0.0
+                    if has_load or has_temp:
+                        telemetry_gpus.append(item)
+                has_multi_gpu = len(telemetry_gpus) > 1
 
             # Keep base "gpu" card as single/aggregate view.
             if valid_gpus:
@@ -886,22 +1074,30 @@ class MetricsMixin:
                 first_name = valid_gpus[0].get("name")
                 if first_name:
                     self.gpu_name = self._normalize_gpu_name(first_name)
-                loads = [float(item["load"]) for item in telemetry_gpus if item.get("load") is not None]
-                if loads and not self.metric_locks.get("gpu", True):
+                load_sum = 0.0
+                load_count = 0
+                for item in telemetry_gpus:
+                    load = item.get("load")
+                    if load is not None:
+                        load_sum += float(load)
+                        load_count += 1
+                if load_count and not locks.get("gpu", True):
                     # Aggregate: average across GPUs.
-                    self._set_metric_value("gpu", sum(loads) / float(len(loads)))
-                elif self.metric_locks.get("gpu", True):
-                    parts = self.metric_cards.get("gpu")
+                    set_val("gpu", load_sum / load_count)
+                elif locks.get("gpu", True):
+                    parts = cards.get("gpu")
                     if parts:
-                        parts["value"].setText(self.lang_handler.tr("graph_blocked_no_permissions"))
+                        parts["value"].setText(self._blocked_no_perms_text)
 
             # Remove stale per-GPU cards if device list changed or if only one GPU remains.
-            existing_gpu_metrics = [name for name in self.metric_cards.keys() if name.startswith("gpu:")]
-            incoming_gpu_metrics = {f"gpu:{item.get('id')}" for item in telemetry_gpus}
-            for metric_name in existing_gpu_metrics:
-                if metric_name in incoming_gpu_metrics and has_multi_gpu:
-                    continue
-                self._remove_metric_card(metric_name, "gpu")
+            if has_multi_gpu:
+                incoming_gpu_metrics = {f"gpu:{item.get('id')}" for item in telemetry_gpus}
+                for metric_name in gpu_names:
+                    if metric_name not in incoming_gpu_metrics:
+                        self._remove_metric_card(metric_name, "gpu")
+            else:
+                for metric_name in gpu_names:
+                    self._remove_metric_card(metric_name, "gpu")
 
             # Add per-GPU cards only when there are 2+ GPUs to avoid duplicate single-GPU entry.
             if has_multi_gpu:
@@ -912,78 +1108,94 @@ class MetricsMixin:
                     metric_name = f"gpu:{gpu_id}"
                     load = item.get("load")
                     temp = item.get("temp")
-                    is_active = (load is not None and self._is_value_active("gpu", load)) or (temp is not None and float(temp) > 0.0)
-                    if metric_name not in self.metric_cards:
+                    is_active = (load is not None and value_active("gpu", load)) or (temp is not None and float(temp) > 0.0)
+                    if metric_name not in cards:
                         if not is_active:
                             continue
-                        self._add_metric_card(metric_name, "graph_gpu_load", "%", 100.0, peak_window=6, protected=True)
-                    if load is not None and not self.metric_locks.get("gpu", True):
-                        self._set_metric_value(metric_name, float(load))
-                    elif self.metric_locks.get("gpu", True):
-                        parts = self.metric_cards.get(metric_name)
+                        add_card(metric_name, "graph_gpu_load", "%", 100.0, peak_window=6, protected=True)
+                    if load is not None and not locks.get("gpu", True):
+                        set_val(metric_name, float(load))
+                    elif locks.get("gpu", True):
+                        parts = cards.get(metric_name)
                         if parts:
-                            parts["value"].setText(self.lang_handler.tr("graph_blocked_no_permissions"))
+                            parts["value"].setText(self._blocked_no_perms_text)
                     self._set_card_subtitle(metric_name, self._metric_card_subtitle(metric_name))
 
         gpu = data.get("gpu_nvidia") or data.get("gpu_others") or data.get("gpu")
-        if gpu is not None and not self.metric_locks.get("gpu", True):
+        if gpu is not None and not locks.get("gpu", True):
             # Fallback path when per-card GPU list is unavailable.
             if not isinstance(gpu_all, list) or not gpu_all:
-                self._set_metric_value("gpu", float(gpu))
+                set_val("gpu", float(gpu))
 
         # If backend no longer reports gpu_all, clear per-GPU cards to avoid stale duplicates.
-        if ("gpu_all" not in data) and any(name.startswith("gpu:") for name in self.metric_cards.keys()):
-            for metric_name in [name for name in self.metric_cards.keys() if name.startswith("gpu:")]:
+        if "gpu_all" not in data:
+            for metric_name in gpu_names:
                 self._remove_metric_card(metric_name, "gpu")
 
         cpu_temp = data.get("cpu_temp")
         if cpu_temp is not None:
-            self.latest_sensor_values["cpu_temp"] = float(cpu_temp)
+            lsv["cpu_temp"] = float(cpu_temp)
             if self.selected_metric == "cpu":
                 self._refresh_primary_info("cpu")
 
         gpu_temp = data.get("gpu_temp")
         if gpu_temp is not None:
-            self.latest_sensor_values["gpu_temp"] = float(gpu_temp)
+            lsv["gpu_temp"] = float(gpu_temp)
             if self.selected_metric == "gpu":
                 self._refresh_primary_info("gpu")
 
         net_total = data.get("net")
         if net_total is not None:
-            self._set_metric_value("net_total", float(net_total))
+            set_val("net_total", float(net_total))
         net_rx = data.get("net_rx")
         net_tx = data.get("net_tx")
         if net_rx is not None:
-            self.latest_sensor_values["net_rx"] = float(net_rx)
+            lsv["net_rx"] = float(net_rx)
         if net_tx is not None:
-            self.latest_sensor_values["net_tx"] = float(net_tx)
+            lsv["net_tx"] = float(net_tx)
 
         net_all = data.get("net_all")
+        if isinstance(net_all, dict) and any(name not in net_all for name in self._iface_kind_cache):
+            # Interface set changed (hotplug/rename); re-probe kinds lazily.
+            self._iface_kind_cache.clear()
         net_meta = data.get("net_meta")
         if isinstance(net_meta, dict):
-            self.latest_sensor_values["net_meta"] = net_meta
+            lsv["net_meta"] = net_meta
 
         bt_all = data.get("bt_all")
         if isinstance(bt_all, dict):
-            self.latest_sensor_values["bt_all"] = bt_all
+            lsv["bt_all"] = bt_all
 
         merged_bt_adapters = set()
         net_bt_merge = {}
         if isinstance(net_all, dict) and net_all and isinstance(bt_all, dict) and bt_all:
             # Merge BT telemetry into NET tab when both share same PCI slot (2-in-1 cards).
-            slot_to_iface = {}
-            for iface_name in net_all.keys():
-                slot = ((self.latest_sensor_values.get("net_meta") or {}).get(iface_name) or {}).get("slot")
-                if slot:
-                    slot_to_iface.setdefault(str(slot), []).append(iface_name)
-
-            for bt_adapter, bt_item in bt_all.items():
-                if not isinstance(bt_item, dict):
-                    continue
-                slot = str(bt_item.get("slot") or "").strip()
-                if not slot or slot not in slot_to_iface:
+            # The adapter -> iface pairing only changes on hotplug, so it is rebuilt
+            # on the dynamic-rebuild cadence; per-tick work is just summing rates.
+            bt_targets = self._net_bt_targets
+            if bt_targets is None or can_rebuild_dynamic:
+                net_meta_local = lsv.get("net_meta") or {}
+                slot_to_iface = {}
+                for iface_name in net_all:
+                    meta = net_meta_local.get(iface_name)
+                    if not meta:
+                        continue
+                    slot = meta.get("slot")
+                    if slot:
+                        slot_to_iface.setdefault(str(slot), []).append(iface_name)
+                bt_targets = {}
+                for bt_adapter, bt_item in bt_all.items():
+                    if not isinstance(bt_item, dict):
+                        continue
+                    slot = str(bt_item.get("slot") or "").strip()
+                    if slot and slot in slot_to_iface:
+                        bt_targets[bt_adapter] = slot_to_iface[slot][0]
+                self._net_bt_targets = bt_targets
+
+            for bt_adapter, target_iface in bt_targets.items():
+                bt_item = bt_all.get(bt_adapter)
+                if not isinstance(bt_item, dict) or target_iface not in net_all:
                     continue
-                target_iface = slot_to_iface[slot][0]
                 bucket = net_bt_merge.setdefault(
                     target_iface,
                     {"merged": True, "bt_mbps": 0.0, "bt_rx_mbps": 0.0, "bt_tx_mbps": 0.0, "adapters": []},
@@ -994,114 +1206,104 @@ class MetricsMixin:
                 bt_label = str(bt_item.get("name") or bt_adapter)
                 bucket["adapters"].append(bt_label)
                 merged_bt_adapters.add(bt_adapter)
-        self.latest_sensor_values["net_bt_merge"] = net_bt_merge
+        lsv["net_bt_merge"] = net_bt_merge
 
         if isinstance(net_all, dict) and net_all:
+            net_names = []
+            active_net_names = []
             for iface_name, iface_val in net_all.items():
                 metric_name = f"net:{iface_name}"
-                merge_extra = float((net_bt_merge.get(iface_name) or {}).get("bt_mbps", 0.0))
+                merge_extra = float(net_bt_merge.get(iface_name, _EMPTY_DICT).get("bt_mbps", 0.0))
                 val = float(iface_val) + merge_extra
-                self.metric_last_seen[metric_name] = now
-                if self._is_value_active(metric_name, val):
-                    self.metric_last_active[metric_name] = now
-                    self.dynamic_metric_hidden.discard(metric_name)
-                if metric_name not in self.metric_cards:
-                    if not can_rebuild_dynamic:
-                        continue
-                    if not self._is_value_active(metric_name, val):
+                net_names.append(metric_name)
+                active = value_active(metric_name, val)
+                if active:
+                    active_net_names.append(metric_name)
+                if metric_name not in cards:
+                    if not can_rebuild_dynamic or not active:
                         continue
-                    self._add_metric_card(metric_name, "graph_net_iface", "Mbps", None, peak_window=4, protected=False)
-                self._set_metric_value(metric_name, val)
+                    add_card(metric_name, "graph_net_iface", "Mbps", None, peak_window=4, protected=False)
+                set_val(metric_name, val)
+            seen_map.update(dict.fromkeys(net_names, now))
+            active_map.update(dict.fromkeys(active_net_names, now))
+            hidden.difference_update(active_net_names)
 
         if isinstance(bt_all, dict):
+            bt_names = []
             for adapter_name, bt_item in bt_all.items():
                 if not isinstance(bt_item, dict):
                     continue
                 if adapter_name in merged_bt_adapters:
                     # 2-in-1 card: merged into corresponding NET tab.
                     metric_name = f"bt:{adapter_name}"
-                    if metric_name in self.metric_cards:
+                    if metric_name in cards:
                         self._remove_metric_card(metric_name, "net_total")
                     continue
                 metric_name = f"bt:{adapter_name}"
                 val = float(bt_item.get("mbps", 0.0))
-                self.metric_last_seen[metric_name] = now
-                # Presence-based: keep adapter card even if idle.
-                self.metric_last_active[metric_name] = now
-                self.dynamic_metric_hidden.discard(metric_name)
-                if metric_name not in self.metric_cards:
+                bt_names.append(metric_name)
+                if metric_name not in cards:
                     if not can_rebuild_dynamic:
                         continue
-                    self._add_metric_card(metric_name, "graph_bt_iface", "Mbps", None, peak_window=4, protected=False)
-                self._set_metric_value(metric_name, val)
-
-        for key in (
-            "sys_processes_total",
-            "sys_procs_running",
-            "sys_procs_blocked",
-            "sys_uptime_s",
-            "sys_load_1m",
-            "sys_load_5m",
-            "sys_load_15m",
-            "sys_mem_total_kb",
-            "sys_mem_available_kb",
-            "sys_swap_total_kb",
-            "sys_swap_free_kb",
-            "sys_cpu_count",
-            "sys_cpu_vendor",
-            "sys_cpu_packages",
-            "sys_cpu_cores_usage",
-        ):
-            if key in data:
-                self.latest_sensor_values[key] = data[key]
-        self._update_cpu_core_graphs(self.latest_sensor_values.get("sys_cpu_cores_usage") or [])
-        if self.selected_metric in self.metric_cards:
+                    add_card(metric_name, "graph_bt_iface", "Mbps", None, peak_window=4, protected=False)
+                set_val(metric_name, val)
+            # Presence-based: keep adapter card even if idle.
+            stamp = dict.fromkeys(bt_names, now)
+            seen_map.update(stamp)
+            active_map.update(stamp)
+            hidden.difference_update(bt_names)
+
+        for key in _SYS_KEYS.intersection(data):
+            lsv[key] = data[key]
+        self._update_cpu_core_graphs(lsv.get("sys_cpu_cores_usage") or [])
+        if self.selected_metric in cards:
             self._refresh_primary_info(self.selected_metric)
 
         all_disks = data.get("disc_all")
         if isinstance(all_disks, dict) and all_disks:
-            for disk_name, disk_val in all_disks.items():
-                metric_name = f"disk:{disk_name}"
+            disk_names = [f"disk:{disk_name}" for disk_name in all_disks]
+            # Disk presence itself is treated as active feedback.
+            stamp = dict.fromkeys(disk_names, now)
+            seen_map.update(stamp)
+            active_map.update(stamp)
+            hidden.difference_update(disk_names)
+            for metric_name, disk_val in zip(disk_names, all_disks.values()):
                 val = float(disk_val)
-                self.metric_last_seen[metric_name] = now
-                # Disk presence itself is treated as active feedback.
-                self.metric_last_active[metric_name] = now
-                self.dynamic_metric_hidden.discard(metric_name)
-                if metric_name not in self.metric_cards:
+                if metric_name not in cards:
                     if not can_rebuild_dynamic:
                         continue
-                    self._add_metric_card(metric_name, "graph_disk_usage", "%", 100.0, peak_window=6, protected=False)
-                self._set_metric_value(metric_name, val)
+                    add_card(metric_name, "graph_disk_usage", "%", 100.0, peak_window=6, protected=False)
+                set_val(metric_name, val)
         else:
             disk = data.get("disc")
             if disk is not None:
                 metric_name = "disk:disk"
                 val = float(disk)
-                self.metric_last_seen[metric_name] = now
-                self.metric_last_active[metric_name] = now
-                self.dynamic_metric_hidden.discard(metric_name)
-                if metric_name not in self.metric_cards:
+                seen_map[metric_name] = now
+                active_map[metric_name] = now
+                hidden.discard(metric_name)
+                if metric_name not in cards:
                     if can_rebuild_dynamic:
-                        self._add_metric_card(metric_name, "graph_disk_usage", "%", 100.0, peak_window=6, protected=False)
-                if metric_name in self.metric_cards:
-                    self._set_metric_value(metric_name, val)
+                        add_card(metric_name, "graph_disk_usage", "%", 100.0, peak_window=6, protected=False)
+                if metric_name in cards:
+                    set_val(metric_name, val)
 
         if can_rebuild_dynamic:
-            for metric_name in list(self.metric_cards.keys()):
-                if not self._is_dynamic_metric(metric_name):
+            missing_hide = self.dynamic_metric_missing_hide_s
+            idle_hide = self.dynamic_metric_idle_hide_s
+            is_dyn = self._is_dynamic_metric
+            for metric_name in all_names:
+                if metric_name not in cards or not is_dyn(metric_name):
                     continue
-                last_seen = self.metric_last_seen.get(metric_name, 0.0)
-                last_active = self.metric_last_active.get(metric_name, last_seen)
-                if metric_name.startswith("disk:"):
-                    should_remove = (now - last_seen) > self.dynamic_metric_missing_hide_s
-                elif metric_name.startswith("bt:"):
-                    should_remove = (now - last_seen) > self.dynamic_metric_missing_hide_s
+                last_seen = seen_map.get(metric_name, 0.0)
+                dt_seen = now - last_seen
+                if metric_name[:5] == "disk:" or metric_name[:3] == "bt:":
+                    should_remove = dt_seen > missing_hide
                 else:
-                    should_remove = (now - last_seen) > self.dynamic_metric_missing_hide_s or (
-                        now - last_active
-                    ) > self.dynamic_metric_idle_hide_s
+                    dt_active = now - active_map.get(metric_name, last_seen)
+                    should_remove = dt_seen > missing_hide or dt_active > idle_hide
                 if should_remove:
-                    self.dynamic_metric_hidden.add(metric_name)
-                    fallback = "net_total" if metric_name.startswith(("net:", "bt:")) else "cpu"
+                    hidden.add(metric_name)
+                    fallback = "net_total" if metric_name[:4] == "net:" or metric_name[:3] == "bt:" else "cpu"
                     self._remove_metric_card(metric_name, fallback)
             self._dynamic_last_rebuild_ts = now
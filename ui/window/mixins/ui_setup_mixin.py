@@ -1,6 +1,7 @@
 # pyright: reportAttributeAccessIssue=false
-import json
 import os
+from functools import lru_cache
+from pathlib import Path
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon
@@ -20,134 +21,107 @@ from ui.toolbar import MainToolbar
 from ui.widgets.graph_widget import GraphWidget
 
 
+_BASE_DIR = Path(__file__).resolve().parents[3]
+_LANG_DIR = _BASE_DIR / "assets" / "languages"
+_ICON_PATH = _BASE_DIR / "assets" / "icons" / "icon.png"
+
+_BASE_QSS_PATH = _BASE_DIR / "assets" / "styles" / "base.qss"
+
+_SPARK_QSS_DARK = "background-color: #111722; border: 1px solid #2e3748; border-radius: 4px;"
+_SPARK_QSS_LIGHT = "background-color: #e3e9f1; border: 1px solid #8894a8; border-radius: 4px;"
+_SEP_QSS_DARK = "background: rgba(139, 154, 178, 0.78); border: none;"
+_SEP_QSS_LIGHT = "background: rgba(111, 123, 144, 0.88); border: none;"
+# Card label styles: (kind, font px, font family, dark color, light color).
+_CARD_QSS_TEMPLATES = (
+    ("title", 15, "'Noto Sans', 'Segoe UI', sans-serif", "#edf3fb", "#1f2937"),
+    ("subtitle", 11, "'Noto Sans', 'Segoe UI', sans-serif", "#7fa0bf", "#5b667a"),
+    ("value", 12, "'JetBrains Mono', 'DejaVu Sans Mono', monospace", "#9fb0c2", "#475569"),
+)
+
+
+@lru_cache(maxsize=2)
+def _card_label_qss(is_dark):
+    return {
+        kind: f"font-size: {size}px; color: {dark_color if is_dark else light_color}; font-family: {family};"
+        for kind, size, family, dark_color, light_color in _CARD_QSS_TEMPLATES
+    }
+
+
+def _set_qss(widget, qss):
+    # Qt re-parses and re-polishes on every setStyleSheet, even for identical text.
+    if widget.styleSheet() != qss:
+        widget.setStyleSheet(qss)
+
+
+@lru_cache(maxsize=32)
+def _primary_graph_qss(is_dark, accent):
+    if is_dark:
+        return (
+            "background-color: rgba(14, 21, 31, 0.95);"
+            f"border: 1px solid {accent}; border-radius: 7px;"
+        )
+    return (
+        "background-color: rgba(226, 233, 243, 0.96);"
+        f"border: 1px solid {accent}; border-radius: 7px;"
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_base_qss():
+    return _BASE_QSS_PATH.read_text(encoding="utf-8")
+
+
 class UiSetupMixin:
     def apply_base_stylesheet(self):
-        self.setStyleSheet(
-            """
-            #central_widget {
-                background: transparent;
-            }
-            QWidget#dashboard {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 1,
-                    stop: 0 rgba(13, 20, 30, 0.92),
-                    stop: 0.5 rgba(17, 26, 38, 0.90),
-                    stop: 1 rgba(10, 18, 28, 0.94)
-                );
-            }
-            QWidget#mainPanel {
-                background: rgba(10, 18, 28, 0.45);
-                border: 1px solid rgba(114, 126, 145, 0.45);
-                border-radius: 10px;
-            }
-            QWidget#sidebarContent {
-                background: transparent;
-            }
-            #panelSeparatorV,
-            #panelSeparatorH {
-                background: rgba(120, 130, 148, 0.52);
-                border: none;
-            }
-            QFrame#metricCard {
-                border: 1px solid rgba(120, 130, 148, 0.48);
-                border-radius: 10px;
-                background: rgba(20, 30, 44, 0.44);
-            }
-            QFrame#metricCard:hover {
-                border: 1px solid rgba(145, 166, 194, 0.92);
-                background: rgba(31, 47, 70, 0.70);
-            }
-            QFrame#metricCardActive {
-                border: 2px solid rgba(99, 195, 230, 0.95);
-                border-radius: 10px;
-                background: rgba(17, 36, 56, 0.62);
-            }
-            QFrame#metricCardSeparator {
-                background: rgba(136, 148, 168, 0.55);
-                border: none;
-                min-height: 2px;
-                max-height: 2px;
-            }
-            QScrollArea#sidebarScroll,
-            QScrollArea#cpuCoresScroll {
-                background: transparent;
-                border: none;
-            }
-            QScrollArea#sidebarScroll > QWidget#qt_scrollarea_viewport,
-            QScrollArea#cpuCoresScroll > QWidget#qt_scrollarea_viewport {
-                background: transparent;
-                border: none;
-            }
-            QWidget#sidebarContent,
-            QWidget#cpuCoresContent {
-                background: transparent;
-            }
-            QScrollArea#sidebarScroll QScrollBar:vertical,
-            QScrollArea#cpuCoresScroll QScrollBar:vertical {
-                background: rgba(128, 128, 128, 0.25);
-                width: 10px;
-                margin: 2px;
-                border-radius: 5px;
-            }
-            QScrollArea#sidebarScroll QScrollBar::handle:vertical,
-            QScrollArea#cpuCoresScroll QScrollBar::handle:vertical {
-                background: rgba(108, 116, 129, 0.75);
-                min-height: 22px;
-                border-radius: 5px;
-            }
-            QScrollArea#sidebarScroll QScrollBar::handle:vertical:hover,
-            QScrollArea#cpuCoresScroll QScrollBar::handle:vertical:hover {
-                background: rgba(91, 100, 116, 0.9);
-            }
-            QScrollArea#sidebarScroll QScrollBar::add-line:vertical,
-            QScrollArea#sidebarScroll QScrollBar::sub-line:vertical,
-            QScrollArea#cpuCoresScroll QScrollBar::add-line:vertical,
-            QScrollArea#cpuCoresScroll QScrollBar::sub-line:vertical {
-                height: 0;
-            }
-            QScrollArea#sidebarScroll QScrollBar::add-page:vertical,
-            QScrollArea#sidebarScroll QScrollBar::sub-page:vertical,
-            QScrollArea#cpuCoresScroll QScrollBar::add-page:vertical,
-            QScrollArea#cpuCoresScroll QScrollBar::sub-page:vertical {
-                background: transparent;
-            }
-            """
-        )
+        try:
+            qss = _load_base_qss()
+        except OSError as e:
+            self.console_logic.log(f"Base QSS loading error: {e}", "ERROR")
+            return
+        self.setStyleSheet(qss)
+
+    def _invalidate_theme_cache(self):
+        # Call after every theme_manager.apply_theme(); the flag is read per widget.
+        self._is_dark_cached = getattr(self.theme_manager, "current_theme", "dark") == "dark"
 
     def _theme_is_dark(self):
-        return getattr(self.theme_manager, "current_theme", "dark") == "dark"
+        if self._is_dark_cached is None:
+            self._invalidate_theme_cache()
+        return self._is_dark_cached
 
     def _spark_style(self):
-        if self._theme_is_dark():
-            return "background-color: #111722; border: 1px solid #2e3748; border-radius: 4px;"
-        return "background-color: #e3e9f1; border: 1px solid #8894a8; border-radius: 4px;"
+        return _SPARK_QSS_DARK if self._theme_is_dark() else _SPARK_QSS_LIGHT
 
     def _primary_graph_style(self, accent):
-        if self._theme_is_dark():
-            return (
-                "background-color: rgba(14, 21, 31, 0.95);"
-                f"border: 1px solid {accent}; border-radius: 7px;"
-            )
-        return (
-            "background-color: rgba(226, 233, 243, 0.96);"
-            f"border: 1px solid {accent}; border-radius: 7px;"
-        )
+        return _primary_graph_qss(self._theme_is_dark(), accent)
 
     def apply_theme_overrides(self):
         is_dark = self._theme_is_dark()
+        selected = self.metric_cards.get(self.selected_metric)
+        accent = selected.get("accent", "#4ec9b0") if selected else "#4ec9b0"
+        # Restyling every widget is only needed when the palette changed;
+        # new cards style themselves in _add_metric_card.
+        theme_sig = (is_dark, accent)
+        if self._last_theme_qss == theme_sig:
+            return
+        self._last_theme_qss = theme_sig
+
         title_color = "#ecf4ff" if is_dark else "#1f2937"
         subtitle_color = "#9cb1c8" if is_dark else "#5b667a"
         info_color = "#d2deec" if is_dark else "#334155"
 
-        self.page_title.setStyleSheet(
+        _set_qss(
+            self.page_title,
             f"font-size: 18px; color: {title_color}; font-weight: 600; letter-spacing: 0.3px;"
             "font-family: 'Noto Sans', 'Segoe UI', sans-serif;"
         )
-        self.primary_title.setStyleSheet(
+        _set_qss(
+            self.primary_title,
             f"font-size: 34px; color: {title_color}; font-weight: 600;"
             "font-family: 'Noto Sans', 'Segoe UI', sans-serif;"
         )
-        self.primary_subtitle.setStyleSheet(
+        _set_qss(
+            self.primary_subtitle,
             f"font-size: 17px; color: {subtitle_color}; font-family: 'Noto Sans', 'Segoe UI', sans-serif;"
         )
 
@@ -155,63 +129,47 @@ class UiSetupMixin:
             f"color: {info_color}; font-size: 14px; line-height: 1.3;"
             "font-family: 'JetBrains Mono', 'DejaVu Sans Mono', monospace;"
         )
-        self.info_left.setStyleSheet(info_style)
-        self.info_right.setStyleSheet(info_style)
+        _set_qss(self.info_left, info_style)
+        _set_qss(self.info_right, info_style)
 
         self.primary_graph.update_theme(is_dark)
-        selected = self.metric_cards.get(self.selected_metric)
-        accent = selected.get("accent", "#4ec9b0") if selected else "#4ec9b0"
-        self.primary_graph.setStyleSheet(self._primary_graph_style(accent))
-
-        card_title_color = "#edf3fb" if is_dark else "#1f2937"
-        card_subtitle_color = "#7fa0bf" if is_dark else "#5b667a"
-        card_value_color = "#9fb0c2" if is_dark else "#475569"
-        for parts in self.metric_cards.values():
-            parts["title"].setStyleSheet(
-                f"font-size: 15px; color: {card_title_color}; font-family: 'Noto Sans', 'Segoe UI', sans-serif;"
-            )
-            parts["subtitle"].setStyleSheet(
-                f"font-size: 11px; color: {card_subtitle_color}; font-family: 'Noto Sans', 'Segoe UI', sans-serif;"
-            )
-            parts["value"].setStyleSheet(
-                f"font-size: 12px; color: {card_value_color}; font-family: 'JetBrains Mono', 'DejaVu Sans Mono', monospace;"
-            )
-            parts["spark"].setStyleSheet(self._spark_style())
-            parts["spark"].update_theme(is_dark)
+        _set_qss(self.primary_graph, _primary_graph_qss(is_dark, accent))
 
-        sep_color = "rgba(139, 154, 178, 0.78)" if is_dark else "rgba(111, 123, 144, 0.88)"
-        for sep in getattr(self, "metric_card_separators", {}).values():
-            sep.setStyleSheet(f"background: {sep_color}; border: none;")
+        spark_qss = _SPARK_QSS_DARK if is_dark else _SPARK_QSS_LIGHT
+        sep_qss = _SEP_QSS_DARK if is_dark else _SEP_QSS_LIGHT
+
+        card_labels = {"title": self._card_titles, "subtitle": self._card_subtitles, "value": self._card_values}
+        for kind, qss in _card_label_qss(is_dark).items():
+            for lbl in card_labels[kind].values():
+                _set_qss(lbl, qss)
+        for spark in self._card_sparks.values():
+            _set_qss(spark, spark_qss)
+            spark.update_theme(is_dark)
+
+        for sep in self.metric_card_separators.values():
+            _set_qss(sep, sep_qss)
 
         for graph in self.cpu_core_graphs.values():
-            graph.setStyleSheet(self._spark_style())
+            _set_qss(graph, spark_qss)
             graph.update_theme(is_dark)
-        for graph in getattr(self, "power_sensor_graphs", {}).values():
-            graph.setStyleSheet(self._spark_style())
+        for graph in self.power_sensor_graphs.values():
+            _set_qss(graph, spark_qss)
             graph.update_theme(is_dark)
 
     def repair_language_file(self):
-        base_dir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        )
-        lang_dir = os.path.join(base_dir, "assets", "languages")
-        if not os.path.exists(lang_dir):
-            os.makedirs(lang_dir)
-        for lang_file in ["en-us.json", "pl-pl.json"]:
-            path = os.path.join(lang_dir, lang_file)
-            if not os.path.exists(path) or os.path.getsize(path) == 0:
-                with open(path, "w", encoding="utf-8") as f:
-                    json.dump({}, f)
+        _LANG_DIR.mkdir(parents=True, exist_ok=True)
+        with os.scandir(_LANG_DIR) as entries:
+            sizes = {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+        for lang_file in ("en-us.json", "pl-pl.json"):
+            if sizes.get(lang_file, 0) == 0:
+                (_LANG_DIR / lang_file).write_text("{}", encoding="utf-8")
 
     def setup_icon(self):
-        base_path = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        )
-        icon_path = os.path.join(base_path, "assets", "icons", "icon.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if _ICON_PATH.exists():
+            self.setWindowIcon(QIcon(str(_ICON_PATH)))
 
     def setup_ui(self):
+        self.metric_card_separators = {}
         self.setWindowTitle(self.lang_handler.tr("window_title"))
         screen = QApplication.primaryScreen()
         if screen is not None:
@@ -252,7 +210,6 @@ class UiSetupMixin:
         self.sidebar_layout = QVBoxLayout(self.sidebar_widget)
         self.sidebar_layout.setContentsMargins(0, 0, 0, 0)
         self.sidebar_layout.setSpacing(10)
-        self.metric_card_separators = {}
 
         self.sidebar_scroll = QScrollArea()
         self.sidebar_scroll.setObjectName("sidebarScroll")
@@ -361,16 +318,20 @@ class UiSetupMixin:
         content.addWidget(self.main_panel, 1)
         root.addWidget(self.dashboard, 1)
 
-        self._add_metric_card("cpu", "graph_cpu_load", "%", 100.0, peak_window=3)
-        self._add_metric_card("ram", "gauge_ram", "%", 100.0, peak_window=3)
-        self._add_metric_card("gpu", "graph_gpu_load", "%", 100.0, peak_window=6, protected=True)
-        self._add_metric_card("psu", "graph_psu_power", "W", None, peak_window=4)
-        self._add_metric_card("net_total", "graph_net_total", "Mbps", None, peak_window=4)
+        for name, title_key, unit, max_value, peak_window, protected in (
+            ("cpu", "graph_cpu_load", "%", 100.0, 3, False),
+            ("ram", "gauge_ram", "%", 100.0, 3, False),
+            ("gpu", "graph_gpu_load", "%", 100.0, 6, True),
+            ("psu", "graph_psu_power", "W", None, 4, False),
+            ("net_total", "graph_net_total", "Mbps", None, 4, False),
+        ):
+            self._add_metric_card(name, title_key, unit, max_value, peak_window=peak_window, protected=protected)
 
         self.sidebar_layout.addStretch()
         self._select_metric("cpu")
 
     def _add_metric_card(self, metric_name, title_key, unit, max_value, peak_window=1, protected=False):
+        prev_name = next(reversed(self.metric_cards), None)
         card = QFrame()
         card.setObjectName("metricCard")
 
@@ -383,8 +344,13 @@ class UiSetupMixin:
         spark.setMaximumHeight(52)
         spark.setMinimumWidth(74)
         spark.setMaximumWidth(74)
-        spark.setStyleSheet(self._spark_style())
-        spark.set_accent_color(self._metric_accent(metric_name))
+        # New cards (also dynamic ones created mid-tick) are styled before their first paint.
+        is_dark = self._theme_is_dark()
+        label_qss = _card_label_qss(is_dark)
+        spark.setStyleSheet(_SPARK_QSS_DARK if is_dark else _SPARK_QSS_LIGHT)
+        accent = self._metric_accent(metric_name)
+        spark.set_accent_color(accent)
+        spark.update_theme(is_dark)
 
         text_col = QVBoxLayout()
         text_col.setContentsMargins(0, 0, 0, 0)
@@ -393,19 +359,13 @@ class UiSetupMixin:
         title_lbl = QLabel()
         title_lbl.setWordWrap(False)
         title_lbl.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
-        title_lbl.setStyleSheet(
-            "font-size: 16px; font-family: 'Noto Sans', 'Segoe UI', sans-serif;"
-        )
+        title_lbl.setStyleSheet(label_qss["title"])
         subtitle_lbl = QLabel()
         subtitle_lbl.setWordWrap(False)
         subtitle_lbl.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
-        subtitle_lbl.setStyleSheet(
-            "font-size: 12px; font-family: 'Noto Sans', 'Segoe UI', sans-serif;"
-        )
+        subtitle_lbl.setStyleSheet(label_qss["subtitle"])
         value_lbl = QLabel("0")
-        value_lbl.setStyleSheet(
-            "font-size: 13px; font-family: 'JetBrains Mono', 'DejaVu Sans Mono', monospace;"
-        )
+        value_lbl.setStyleSheet(label_qss["value"])
 
         text_col.addWidget(title_lbl)
         text_col.addWidget(subtitle_lbl)
@@ -431,61 +391,69 @@ class UiSetupMixin:
             "protected": protected,
             "last": 0.0,
             "seen": False,
-            "accent": self._metric_accent(metric_name),
+            "title_text": None,
+            "subtitle_text": None,
+            "accent": accent,
         }
+        self._card_titles[metric_name] = title_lbl
+        self._card_subtitles[metric_name] = subtitle_lbl
+        self._card_values[metric_name] = value_lbl
+        self._card_sparks[metric_name] = spark
         insert_at = self.sidebar_layout.count()
         if insert_at > 0:
             tail_item = self.sidebar_layout.itemAt(insert_at - 1)
             if tail_item is not None and tail_item.spacerItem() is not None:
                 insert_at -= 1
         self.sidebar_layout.insertWidget(insert_at, card)
-        self._refresh_metric_separators()
+        # Only the previous tail card gains a separator; existing ones stay put.
+        if prev_name is not None:
+            self._append_metric_separator_for(prev_name)
         self._set_card_title(metric_name, self._metric_display_name(metric_name))
         self._set_card_subtitle(metric_name, self._metric_card_subtitle(metric_name))
-        self.apply_theme_overrides()
 
     def _refresh_metric_separators(self):
         # Remove old separators first.
         for sep in self.metric_card_separators.values():
-            try:
-                self.sidebar_layout.removeWidget(sep)
-                sep.setParent(None)
-            except Exception:
-                pass
+            self.sidebar_layout.removeWidget(sep)
+            sep.setParent(None)
         self.metric_card_separators = {}
 
         # Insert separators between visible metric cards.
         names = list(self.metric_cards.keys())
-        for i in range(len(names) - 1):
-            upper = self.metric_cards[names[i]].get("card")
-            if upper is None:
-                continue
-            sep = QFrame()
-            sep.setObjectName("metricCardSeparator")
-            sep.setFrameShape(QFrame.Shape.HLine)
-            sep.setFixedHeight(2)
-            is_dark = self._theme_is_dark() if hasattr(self, "_theme_is_dark") else True
-            color = "rgba(139, 154, 178, 0.78)" if is_dark else "rgba(111, 123, 144, 0.88)"
-            sep.setStyleSheet(f"background: {color}; border: none;")
-            idx = self.sidebar_layout.indexOf(upper)
-            if idx >= 0:
-                self.sidebar_layout.insertWidget(idx + 1, sep)
-                self.metric_card_separators[names[i]] = sep
-
-    def _shorten_text(self, text, max_len):
-        if text is None:
-            return ""
-        text = str(text).strip()
-        if len(text) <= max_len:
-            return text
-        return text[: max(1, max_len - 1)].rstrip() + "…"
+        for name in names[:-1]:
+            self._append_metric_separator_for(name)
+
+    def _append_metric_separator_for(self, metric_name):
+        upper = self.metric_cards[metric_name].get("card")
+        if upper is None:
+            return
+        idx = self.sidebar_layout.indexOf(upper)
+        if idx < 0:
+            return
+        sep = QFrame()
+        sep.setObjectName("metricCardSeparator")
+        sep.setFrameShape(QFrame.Shape.HLine)
+        sep.setFixedHeight(2)
+        sep.setStyleSheet(_SEP_QSS_DARK if self._theme_is_dark() else _SEP_QSS_LIGHT)
+        self.sidebar_layout.insertWidget(idx + 1, sep)
+        self.metric_card_separators[metric_name] = sep
+
+    def _elide_text(self, label, text, max_chars):
+        # Budget in average glyphs so the cut point does not depend on the
+        # label's current (possibly not yet laid out) width.
+        label.ensurePolished()
+        fm = label.fontMetrics()
+        return fm.elidedText(text, Qt.TextElideMode.ElideRight, fm.averageCharWidth() * max_chars)
 
     def _set_card_title(self, metric_name, full_title):
         parts = self.metric_cards.get(metric_name)
         if not parts:
             return
         full = str(full_title)
-        short = self._shorten_text(full, 30)
+        if parts.get("title_text") == full:
+            return
+        parts["title_text"] = full
+        short = self._elide_text(parts["title"], full, 30)
         parts["title"].setText(short)
         parts["title"].setToolTip(full if short != full else "")
 
@@ -494,18 +462,28 @@ class UiSetupMixin:
         if not parts:
             return
         full = str(full_subtitle or "")
-        short = self._shorten_text(full, 34)
+        # Called on every value tick; skip the Qt label update when nothing changed.
+        if parts.get("subtitle_text") == full:
+            return
+        parts["subtitle_text"] = full
+        short = self._elide_text(parts["subtitle"], full, 34)
         parts["subtitle"].setText(short)
         parts["subtitle"].setToolTip(full if short != full else "")
 
     def _set_primary_subtitle(self, text):
         full = str(text)
-        short = self._shorten_text(full, 64)
+        if self._primary_subtitle_text == full:
+            return
+        self._primary_subtitle_text = full
+        short = self._elide_text(self.primary_subtitle, full, 64)
         self.primary_subtitle.setText(short)
         self.primary_subtitle.setToolTip(full if short != full else "")
 
     def _set_primary_title(self, text):
         full = str(text)
-        short = self._shorten_text(full, 42)
+        if self._primary_title_text == full:
+            return
+        self._primary_title_text = full
+        short = self._elide_text(self.primary_title, full, 42)
         self.primary_title.setText(short)
         self.primary_title.setToolTip(full if short != full else "")